@@ -0,0 +1,3 @@
+from .base_transformer import BaseTransformer
+
+__all__ = ["BaseTransformer"]
@@ -0,0 +1,292 @@
+"""Base transformer.
+
+Common interface of the transformers, compatible with the scikit-learn
+estimator protocol so that they can be used in a `sklearn.pipeline.Pipeline`.
+
+Inputs can be polars, pyarrow (Table, RecordBatch), NumPy or pandas objects.
+Arrow data is converted with `polars.from_arrow` which does not copy the
+buffers. The output format is chosen with `set_output`:
+
+- default / polars: polars.DataFrame
+- arrow: pyarrow.Table, sharing the polars buffers
+- numpy: Fortran-ordered array, without copy when the columns allow it
+- pandas: pandas.DataFrame
+
+NaN values in NumPy inputs are considered missing and converted to nulls,
+which copies the float columns. The columns of mixed-type (object) arrays
+have their dtype inferred from their values. NumPy arrays have no column names: the
+names seen at fit are restored at transform, but a transformer fitted on
+an array only knows generic names (column_0, ...). In a scikit-learn
+pipeline, set the numpy output on the last step only.
+
+Fitted transformers can also stream a file into another file with
+`transform_file`, without loading it in memory.
+"""
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple, Union
+
+import polars
+
+VALID_OUTPUTS = {"default", "polars", "arrow", "numpy", "pandas"}
+FILE_FORMATS: Dict[str, Tuple[Callable[..., polars.LazyFrame], str]] = {
+    ".parquet": (polars.scan_parquet, "sink_parquet"),
+    ".ipc": (polars.scan_ipc, "sink_ipc"),
+    ".arrow": (polars.scan_ipc, "sink_ipc"),
+    ".feather": (polars.scan_ipc, "sink_ipc"),
+    ".csv": (polars.scan_csv, "sink_csv"),
+}
+
+
+def _numpy_to_series(name: str, column: Any) -> polars.Series:
+    """Convert a NumPy column to a polars Series, NaN being missing values.
+
+    Columns of mixed-type (object) arrays have their dtype inferred from
+    their values.
+    """
+    if column.dtype.kind != "O":
+        return polars.Series(name, column, nan_to_null=True)
+    # NaN is the only value not equal to itself
+    values = [None if value != value else value for value in column.tolist()]
+    return polars.Series(name, values, strict=False)
+
+
+class BaseTransformer(ABC):
+    """Base Transformer class.
+
+    Subclasses store the arguments they were created with in `_params` and
+    implement `fit` and `transform`.
+    """
+
+    _params: Dict[str, Any]
+    _output: str = "default"
+    feature_names_in_: Optional[List[str]] = None
+
+    @abstractmethod
+    def fit(self, x: Any, y: Any) -> "BaseTransformer":
+        """Fit the transformer.
+
+        Args:
+            x: features table, polars, pyarrow, NumPy or pandas data
+            y: target, not used by all the transformers
+
+        Returns:
+            self
+        """
+
+    @abstractmethod
+    def transform(self, x: Any) -> Any:
+        """Transform the features table.
+
+        Args:
+            x: features table, polars, pyarrow, NumPy or pandas data
+
+        Returns:
+            transformed data, a LazyFrame for a LazyFrame input
+        """
+
+    def get_params(self, deep: bool = True) -> Dict[str, Any]:
+        """Get the parameters of the transformer.
+
+        Args:
+            deep (bool): not used, the transformers have no sub-estimators
+
+        Returns:
+            dict: parameters the transformer was created with
+        """
+        return dict(self._params)
+
+    def set_params(self, **params) -> "BaseTransformer":
+        """Set the parameters of the transformer.
+
+        The transformer is reinitialized and has to be fitted again.
+
+        Args:
+            params (dict): parameters to update
+
+        Returns:
+            self
+        """
+        output = self._output
+        self.__init__(**{**self._params, **params})  # type: ignore
+        self._output = output
+        return self
+
+    def set_output(self, *, transform: Optional[str] = None) -> "BaseTransformer":
+        """Set the output container of transform.
+
+        Args:
+            transform (str): one of default, polars, arrow, numpy, pandas,
+                             unchanged if None
+
+        Returns:
+            self
+        """
+        if transform is None:
+            return self
+        if transform not in VALID_OUTPUTS:
+            raise ValueError(f"transform must be one of {VALID_OUTPUTS}")
+        self._output = transform
+        return self
+
+    def get_feature_names_out(
+        self, input_features: Optional[List[str]] = None
+    ) -> List[str]:
+        """Get the names of the output features.
+
+        Args:
+            input_features (list): not used, the names seen at fit are used
+
+        Returns:
+            list: names of the columns returned by transform
+        """
+        if self.feature_names_in_ is None:
+            raise ValueError(f"{type(self).__name__} is not fitted")
+        return list(self.feature_names_in_)
+
+    def _to_polars(
+        self, x: Any, reset: bool = False
+    ) -> Union[polars.DataFrame, polars.LazyFrame]:
+        """Convert the input to a polars DataFrame.
+
+        LazyFrames are returned as they are.
+
+        Args:
+            x: polars, pyarrow, NumPy or pandas data
+            reset (bool): record the feature names (at fit time)
+
+        Returns:
+            polars.DataFrame: input as a polars DataFrame
+        """
+        module = type(x).__module__.split(".")[0]
+        if isinstance(x, (polars.DataFrame, polars.LazyFrame)):
+            pass
+        elif isinstance(x, polars.Series):
+            x = x.to_frame()
+        elif module == "pyarrow":
+            x = polars.from_arrow(x)
+        elif module == "numpy":
+            x = x.reshape(len(x), -1)
+            names = [f"column_{i}" for i in range(x.shape[1])]
+            if not reset and self.feature_names_in_ is not None:
+                if x.shape[1] != len(self.feature_names_in_):
+                    raise ValueError(
+                        f"x has {x.shape[1]} features, but {type(self).__name__} "
+                        f"was fitted with {len(self.feature_names_in_)} features"
+                    )
+                names = self.feature_names_in_
+            # Columns are converted one by one, they are contiguous in a
+            # Fortran-ordered array
+            x = polars.DataFrame(
+                [_numpy_to_series(name, x[:, i]) for i, name in enumerate(names)]
+            )
+        elif module == "pandas":
+            x = polars.from_pandas(x)
+        else:
+            raise TypeError(f"Unsupported input type {type(x).__name__}")
+        if reset:
+            self.feature_names_in_ = x.collect_schema().names()
+        return x
+
+    @staticmethod
+    def _target_to_polars(y: Any) -> Union[polars.Series, polars.DataFrame]:
+        """Convert the target to a polars Series or DataFrame.
+
+        Args:
+            y: polars, pyarrow, NumPy or pandas target
+
+        Returns:
+            polars.Series | polars.DataFrame: target
+        """
+        module = type(y).__module__.split(".")[0]
+        if isinstance(y, (polars.Series, polars.DataFrame)):
+            return y
+        if module == "pyarrow":
+            return polars.from_arrow(y)
+        if module == "pandas":
+            return polars.from_pandas(y)
+        return polars.Series("target", y)
+
+    def _to_output(self, x: Union[polars.DataFrame, polars.LazyFrame]) -> Any:
+        """Convert the transformed data to the output container.
+
+        LazyFrames are returned as they are.
+
+        Args:
+            x (polars.DataFrame | polars.LazyFrame): transformed data
+
+        Returns:
+            transformed data in the format chosen with set_output
+        """
+        if isinstance(x, polars.LazyFrame):
+            return x
+        if self._output == "arrow":
+            return x.to_arrow()
+        if self._output == "numpy":
+            return x.to_numpy(order="fortran")
+        if self._output == "pandas":
+            return x.to_pandas()
+        return x
+
+    def transform_file(
+        self,
+        src: Union[str, Path],
+        dst: Union[str, Path],
+        chunk_size: Optional[int] = None,
+        **sink_kwargs,
+    ) -> Dict[str, float]:
+        """Transform a file into another file with bounded memory.
+
+        The source is scanned lazily, transformed with expressions and
+        written with the streaming engine, so the file never has to fit
+        in memory. The format is deduced from the file extension
+        (parquet, ipc/arrow/feather or csv).
+
+        Args:
+            src (str | Path): file to transform
+            dst (str | Path): file to write
+            chunk_size (int): number of rows processed at once by the
+                              streaming engine, polars default if None
+            sink_kwargs (dict): arguments passed to the sink method,
+                                e.g. compression or row_group_size
+
+        Returns:
+            dict: number of rows, duration in seconds and rows per second
+        """
+        formats: Dict[
+            Union[str, Path], Tuple[Callable[..., polars.LazyFrame], str]
+        ] = {}
+        for path in [src, dst]:
+            suffix = Path(path).suffix.lower()
+            if suffix not in FILE_FORMATS:
+                raise ValueError(
+                    f"file extension must be one of {list(FILE_FORMATS.keys())}"
+                )
+            formats[path] = FILE_FORMATS[suffix]
+
+        scan, _ = formats[src]
+        lazy = self.transform(scan(src))
+        config: ContextManager[Any] = nullcontext()
+        if chunk_size is not None:
+            config = polars.Config(streaming_chunk_size=chunk_size)
+        start = time.perf_counter()
+        with config:
+            getattr(lazy, formats[dst][1])(dst, **sink_kwargs)
+        seconds = time.perf_counter() - start
+
+        # Parquet and IPC row counts are read from the file metadata
+        rows = formats[dst][0](dst).select(polars.len()).collect().item()
+        stats = {
+            "rows": rows,
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds > 0 else float("inf"),
+        }
+        logger = logging.getLogger(__name__)
+        logger.info(
+            f"Transformed {rows} rows from {src} to {dst} in {seconds:.2f}s "
+            f"({stats['rows_per_second']:.0f} rows/s)"
+        )
+        return stats
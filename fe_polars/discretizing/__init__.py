@@ -0,0 +1,3 @@
+from .binning import Binner
+
+__all__ = ["Binner"]
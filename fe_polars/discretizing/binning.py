@@ -0,0 +1,185 @@
+"""Binning.
+
+Binning discretizes numerical features into bins learned at fit time.
+You can choose between different strategies:
+
+- Uniform binning: bins of equal width between the min and the max.
+- Quantile binning: bins holding the same number of records. The quantiles
+  can be approximated on a sample of the rows for large datasets.
+
+The bins are replaced by their index, stored in the smallest unsigned
+integer dtype, so the output can be encoded directly with `TargetEncoder`
+or `OneHotEncoder`.
+"""
+from typing import Any, Dict, List, Optional, Union
+
+import polars
+
+from fe_polars.base import BaseTransformer
+from fe_polars.profile import DataProfile
+from fe_polars.profile.sampling import check_sample_fraction, sample_rows
+
+
+class Binner(BaseTransformer):
+    """Binner class.
+
+    Args:
+        features_to_bin (list): list of features to bin
+        n_bins (int): number of bins
+        strategy (str): binning strategy
+        sample_fraction (float): fraction of the rows used to approximate
+                                 the quantiles
+        seed (int): seed used when sampling
+    """
+
+    def __init__(
+        self,
+        features_to_bin: Union[str, List],
+        n_bins: int = 5,
+        strategy: str = "quantile",
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """Init.
+
+        Args:
+            features_to_bin (str | list): list of features to bin
+            n_bins (int): number of bins, between 2 and 65536
+            strategy (str): uniform or quantile
+            sample_fraction (float): fraction of the rows used to
+                                     approximate the quantiles,
+                                     exact quantiles if None
+            seed (int): seed used when sampling
+        """
+        self._params = {
+            "features_to_bin": features_to_bin,
+            "n_bins": n_bins,
+            "strategy": strategy,
+            "sample_fraction": sample_fraction,
+            "seed": seed,
+        }
+        if isinstance(features_to_bin, str):
+            features_to_bin = [features_to_bin]
+        strategies = ["uniform", "quantile"]
+        if strategy not in strategies:
+            raise ValueError(f"strategy must be one of {strategies}")
+        if not 2 <= n_bins <= 2**16:
+            raise ValueError("n_bins must be between 2 and 65536")
+        check_sample_fraction(sample_fraction)
+        self.features_to_bin = features_to_bin
+        self.n_bins = n_bins
+        self.strategy = strategy
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.mapping: Dict[str, List[Any]] = dict()
+
+    def _edges_expression(self, feature: str) -> polars.Expr:
+        """Build the expression computing the bin edges of a feature."""
+        col = polars.col(feature)
+        if self.strategy == "uniform":
+            width = (col.max() - col.min()) / self.n_bins
+            edges = [col.min() + width * i for i in range(self.n_bins)] + [col.max()]
+        else:
+            edges = [
+                col.quantile(i / self.n_bins, interpolation="linear")
+                for i in range(self.n_bins + 1)
+            ]
+        return polars.concat_list(edges).cast(polars.List(polars.Float64))
+
+    def fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+        profile: Optional[DataProfile] = None,
+    ) -> "Binner":
+        """Fit.
+
+        The edges of all the features are computed in one pass. With the
+        quantile strategy, the rows are sampled once so that all the edges
+        come from the same sample. Repeated quantiles are merged, so a
+        feature can end up with fewer bins.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+            profile (DataProfile): profile of x (not used)
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=True)
+        schema = x.collect_schema()
+        for feature in self.features_to_bin:
+            if not schema[feature].is_numeric():
+                raise ValueError(f"{feature} is not a numerical feature")
+        if self.strategy == "quantile":
+            x = sample_rows(x, self.sample_fraction, self.seed)
+        edges = (
+            x.lazy()
+            .select(
+                [
+                    self._edges_expression(feature).alias(feature)
+                    for feature in self.features_to_bin
+                ]
+            )
+            .collect()
+            .row(0, named=True)
+        )
+        self.mapping = {
+            feature: list(dict.fromkeys(e for e in edges[feature] if e is not None))
+            for feature in self.features_to_bin
+        }
+        return self
+
+    def _binning_expression(self, feature: str) -> polars.Expr:
+        """Build the expression replacing a feature by its bin index.
+
+        The index is the number of inner edges lower or equal to the value,
+        computed with elementwise comparisons so that it can run on the
+        streaming engine. Values out of the fitted range fall in the first
+        or last bin, null values stay null.
+        """
+        inner_edges = self.mapping[feature][1:-1]
+        dtype = polars.UInt8 if len(inner_edges) < 2**8 else polars.UInt16
+        col = polars.col(feature).cast(polars.Float64)
+        index = (
+            polars.sum_horizontal([col >= edge for edge in inner_edges])
+            if inner_edges
+            else polars.lit(0)
+        )
+        return polars.when(col.is_not_null()).then(index).cast(dtype).alias(feature)
+
+    def transform(self, x: Any) -> Any:
+        """Transform.
+
+        A LazyFrame is transformed lazily and returned as a LazyFrame.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+
+        Returns:
+            polars.DataFrame: transformed dataset, in the format chosen
+                              with set_output
+        """
+        x = self._to_polars(x)
+        x = x.with_columns(
+            [self._binning_expression(feature) for feature in self.mapping.keys()]
+        )
+        return self._to_output(x)
+
+    def fit_transform(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+    ) -> Any:
+        """Fit & transform.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+
+        Returns:
+            polars.DataFrame: transformed dataset
+        """
+        self.fit(x=x)
+        return self.transform(x=x)
@@ -1,4 +1,6 @@
 from .one_hot_encoding import OneHotEncoder
+from .online_target_encoding import OnlineTargetEncoder
+from .ordinal_encoding import OrdinalEncoder
 from .target_encoding import TargetEncoder
 
-__all__ = ["TargetEncoder", "OneHotEncoder"]
+__all__ = ["TargetEncoder", "OnlineTargetEncoder", "OneHotEncoder", "OrdinalEncoder"]
@@ -1,10 +1,13 @@
 """One hot encoding."""
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import polars
 
+from fe_polars.base import BaseTransformer
+from fe_polars.profile import DataProfile
 
-class OneHotEncoder:
+
+class OneHotEncoder(BaseTransformer):
     """One Hot Encoder class."""
 
     def __init__(self, features_to_encode: Union[str, List], strategy: str = "drop"):
@@ -14,6 +17,7 @@ class OneHotEncoder:
             features_to_encode (str | list): list of features to encode
             strategy (str): drop or keep the one hot encoded column
         """
+        self._params = {"features_to_encode": features_to_encode, "strategy": strategy}
         if isinstance(features_to_encode, str):
             features_to_encode = [features_to_encode]
         strategies = ["keep", "drop"]
@@ -21,43 +25,98 @@ class OneHotEncoder:
             raise ValueError(f"strategy must be one of {strategies}")
         self.strategy = strategy
         self.features_to_encode = features_to_encode
+        self.mapping: Dict[str, Dict[str, Any]] = dict()
 
     def fit(
         self,
-        x: polars.DataFrame,
+        x: Any,
         y: Optional[Union[polars.Series, polars.DataFrame]] = None,
+        profile: Optional[DataProfile] = None,
     ) -> "OneHotEncoder":
         """Fit One Hot Encoder.
 
+        Learn the categories of each feature, the dummy columns are named
+        as with `polars.DataFrame.to_dummies`.
+
+        Args:
+            x (polars.DataFrame): features table
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+            profile (DataProfile): profile of x (not used)
+
         Returns:
             self
         """
+        x = self._to_polars(x, reset=True)
+        # The categories of all the features are computed in one pass, on a
+        # DataFrame or a LazyFrame
+        uniques = polars.collect_all(
+            [
+                x.lazy().select(polars.col(feature).unique().sort(nulls_last=True))
+                for feature in self.features_to_encode
+            ]
+        )
+        for feature, unique in zip(self.features_to_encode, uniques):
+            categories = unique.to_series()
+            suffixes = categories.cast(polars.Utf8).fill_null("null")
+            self.mapping[feature] = dict(zip(suffixes, categories))
         return self
 
-    def transform(
-        self,
-        x: polars.DataFrame,
-    ) -> polars.DataFrame:
+    def get_feature_names_out(
+        self, input_features: Optional[List[str]] = None
+    ) -> List[str]:
+        """Get the names of the output features.
+
+        Args:
+            input_features (list): not used, the names seen at fit are used
+
+        Returns:
+            list: names of the columns returned by transform
+        """
+        names = super().get_feature_names_out(input_features)
+        if self.strategy == "drop":
+            names = [name for name in names if name not in self.mapping]
+        for feature, categories in self.mapping.items():
+            names += [f"{feature}_{suffix}" for suffix in categories]
+        return names
+
+    def transform(self, x: Any) -> Any:
         """Apply one hot encoding to the provided dataframe.
 
+        The categories are the ones learned at fit, so the encoder has to
+        be fitted first.
+
         Args:
             x (polars.DataFrame): features table to transform
 
         Returns:
-            polars.DataFrame: transformed dataframe
+            polars.DataFrame: transformed dataframe, in the format chosen
+                              with set_output
         """
-        for feature in self.features_to_encode:
-            one_hot = x.select(feature).to_dummies()
-            x = polars.concat([x, one_hot], how="horizontal")
+        if not self.mapping:
+            raise ValueError("OneHotEncoder is not fitted, call fit before transform")
+        x = self._to_polars(x)
+        for feature, categories in self.mapping.items():
+            x = x.with_columns(
+                [
+                    (
+                        polars.col(feature).is_null()
+                        if value is None
+                        else (polars.col(feature) == value).fill_null(False)
+                    )
+                    .cast(polars.UInt8)
+                    .alias(f"{feature}_{suffix}")
+                    for suffix, value in categories.items()
+                ]
+            )
             if self.strategy == "drop":
                 x = x.drop(feature)
-        return x
+        return self._to_output(x)
 
     def fit_transform(
         self,
-        x: polars.DataFrame,
+        x: Any,
         y: Optional[Union[polars.Series, polars.DataFrame]] = None,
-    ) -> polars.DataFrame:
+    ) -> Any:
         """Fit and apply one hot encoding to the provided dataframe.
 
         Args:
@@ -0,0 +1,261 @@
+"""Online target encoding.
+
+Online target encoding keeps the target encoding up to date on streaming
+data. For each category it keeps a count and a sum of the target that
+decay exponentially with the age of the records, measured on an event
+time column: a record one half-life old weighs half as much as a new one.
+
+The counts and sums are stored on a fixed scale, relative to an origin
+time, and decayed at transform time with one global factor. Each
+micro-batch is aggregated with one `group_by` by feature and merged into
+the state on its own categories only: the other categories are neither
+rescaled nor aggregated again, they are only scanned by a semi and an
+anti join keyed on the batch categories. When the global factor
+gets too small, the state is rescaled to the latest event time and the
+categories whose weight fell below `MIN_WEIGHT` are dropped. Late records
+already weighing less than `MIN_WEIGHT` are dropped from their batch.
+
+The encoding uses the smoothing formula of `TargetEncoder` against the
+decayed global mean.
+"""
+from datetime import timedelta
+from typing import Any, List, Optional, Union
+
+import polars
+
+from fe_polars.encoding.target_encoding import TargetEncoder
+from fe_polars.profile import DataProfile
+
+MIN_WEIGHT = 1e-9
+_RESCALE_HALF_LIVES = 30
+_HALF_LIVES = "__half_lives__"
+_WEIGHT = "__weight__"
+
+
+class OnlineTargetEncoder(TargetEncoder):
+    """Online Target Encoder class."""
+
+    def __init__(
+        self,
+        smoothing: int,
+        features_to_encode: Union[str, List],
+        time_column: str,
+        half_life: Union[int, float, timedelta],
+    ):
+        """Init.
+
+        Args:
+            smoothing (int): smoothing to apply
+            features_to_encode (str | list): list of features to encode
+            time_column (str): event time column, temporal or numerical
+            half_life (int | float | timedelta): half-life of the records,
+                                                 a timedelta for a temporal
+                                                 time column
+        """
+        super().__init__(smoothing=smoothing, features_to_encode=features_to_encode)
+        self._params = {
+            "smoothing": smoothing,
+            "features_to_encode": features_to_encode,
+            "time_column": time_column,
+            "half_life": half_life,
+        }
+        if isinstance(half_life, timedelta):
+            positive = half_life > timedelta(0)
+        else:
+            positive = half_life > 0
+        if not positive:
+            raise ValueError("half_life must be positive")
+        self.time_column = time_column
+        self.half_life = half_life
+        self.reference_time: Optional[float] = None
+        self.origin_time: Optional[float] = None
+        self.global_count = 0.0
+        self.global_sum = 0.0
+
+    def _half_lives_expression(self, dtype: polars.DataType) -> polars.Expr:
+        """Build the expression of the event time in half-lives since epoch."""
+        col = polars.col(self.time_column)
+        if dtype.is_temporal():
+            if not isinstance(self.half_life, timedelta):
+                raise ValueError("half_life must be a timedelta for a temporal time")
+            half_life_us = self.half_life / timedelta(microseconds=1)
+            return col.cast(polars.Datetime("us")).dt.epoch("us") / half_life_us
+        if isinstance(self.half_life, timedelta):
+            raise ValueError("half_life must be a number for a numerical time")
+        return col.cast(polars.Float64) / self.half_life
+
+    def fit(
+        self,
+        x: Any,
+        y: Any,
+        profile: Optional[DataProfile] = None,
+    ) -> "OnlineTargetEncoder":
+        """Fit the encoder from scratch on a first batch.
+
+        Args:
+            x (polars.DataFrame): features table with the time column
+            y (y: Union[polars.Series, polars.DataFrame]): target
+            profile (DataProfile): precomputed profile of x
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=True)
+        if profile is None or not set(self.features_to_encode) <= set(profile.columns):
+            profile = DataProfile().fit(x.select(self.features_to_encode))
+        self._check_features_unique_values(profile)
+
+        self.metrics.reset()
+        self.mapping = dict()
+        self.reference_time = None
+        self.origin_time = None
+        self.global_count = 0.0
+        self.global_sum = 0.0
+        return self.partial_fit(x=x, y=y)
+
+    @property
+    def scale(self) -> float:
+        """Decay factor from the origin time to the latest event time."""
+        if self.reference_time is None or self.origin_time is None:
+            return 1.0
+        return 2.0 ** (self.origin_time - self.reference_time)
+
+    def _rescale(self) -> None:
+        """Move the origin to the latest event time.
+
+        The counts and sums are decayed to the latest event time, and the
+        categories weighing less than `MIN_WEIGHT` are dropped.
+        """
+        scale = self.scale
+        self.global_count *= scale
+        self.global_sum *= scale
+        for mapping in self.mapping.values():
+            mapping["table"] = (
+                mapping["table"]
+                .with_columns(polars.col(["count", "sum"]) * scale)
+                .filter(polars.col("count") >= MIN_WEIGHT)
+            )
+        self.origin_time = self.reference_time
+
+    def decayed_counts(self, feature: str) -> polars.DataFrame:
+        """Get the counts and sums of a feature decayed to the latest event time.
+
+        Args:
+            feature (str): encoded feature
+
+        Returns:
+            polars.DataFrame: count and sum of the target by category
+        """
+        return self.mapping[feature]["table"].with_columns(
+            polars.col(["count", "sum"]) * self.scale
+        )
+
+    def partial_fit(self, x: Any, y: Any) -> "OnlineTargetEncoder":
+        """Update the encoding with a micro-batch.
+
+        The records of the batch are weighted relative to the origin time,
+        then their counts and sums are added to the categories of the batch.
+
+        Args:
+            x (polars.DataFrame): features table with the time column
+            y (y: Union[polars.Series, polars.DataFrame]): target
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=self.feature_names_in_ is None)
+        y = self._target_to_polars(y)
+        on = y.columns[0] if isinstance(y, polars.DataFrame) else y.name
+
+        x = (
+            x.with_columns(y)
+            .filter(polars.col(on).is_not_null())
+            .with_columns(
+                self._half_lives_expression(x.schema[self.time_column]).alias(
+                    _HALF_LIVES
+                )
+            )
+        )
+        batch_reference = x[_HALF_LIVES].max()
+        if batch_reference is None:
+            return self
+        if self.reference_time is None:
+            self.reference_time = self.origin_time = batch_reference
+        self.reference_time = max(self.reference_time, batch_reference)
+        # Keep the weights of the batch within the float range
+        if self.reference_time - self.origin_time > _RESCALE_HALF_LIVES:
+            self._rescale()
+
+        # Weights of the whole batch, shared by all the group_by
+        weighted = x.lazy().with_columns(
+            polars.lit(2.0)
+            .pow(polars.col(_HALF_LIVES) - self.origin_time)
+            .alias(_WEIGHT)
+        )
+        aggregations = [
+            polars.col(_WEIGHT).sum().alias("count"),
+            (polars.col(_WEIGHT) * polars.col(on)).sum().alias("sum"),
+        ]
+        batch = polars.collect_all(
+            [weighted.select(aggregations)]
+            + [
+                weighted.drop_nulls(feature).group_by(feature).agg(aggregations)
+                for feature in self.features_to_encode
+            ]
+        )
+
+        self.global_count += batch[0]["count"].item()
+        self.global_sum += batch[0]["sum"].item()
+        self.global_mean = self.global_sum / self.global_count
+
+        for feature, feature_batch in zip(self.features_to_encode, batch[1:]):
+            dtype = self.mapping.get(feature, dict()).get("dtype", x.schema[feature])
+            # Records too old for their weight to count, whose weight can
+            # even underflow to 0, are dropped
+            feature_batch = feature_batch.with_columns(
+                polars.col(feature).cast(dtype)
+            ).filter(polars.col("count") * self.scale >= MIN_WEIGHT)
+            if feature in self.mapping:
+                # Only the categories of the batch are hashed and merged, the
+                # other categories of the state are kept as they are
+                state = self.mapping[feature]["table"].lazy()
+                keys = feature_batch.lazy().select(feature)
+                merged = (
+                    polars.concat(
+                        [feature_batch.lazy(), state.join(keys, on=feature, how="semi")]
+                    )
+                    .group_by(feature)
+                    .agg(polars.col(["count", "sum"]).sum())
+                )
+                feature_batch = polars.concat(
+                    [state.join(keys, on=feature, how="anti"), merged]
+                ).collect()
+            self.mapping[feature] = {"table": feature_batch, "dtype": dtype}
+        return self
+
+    def _encoding_expression(self, feature: str) -> polars.Expr:
+        """Build the expression replacing a feature by its decayed encoding.
+
+        Null and unseen values are replaced by null.
+
+        Args:
+            feature (str): feature to encode
+
+        Returns:
+            polars.Expr: encoding expression
+        """
+        table = self.mapping[feature]["table"]
+        col = polars.col(feature).cast(self.mapping[feature]["dtype"])
+        count, total = [
+            col.replace_strict(
+                table[feature],
+                table[statistic],
+                default=None,
+                return_dtype=polars.Float64,
+            )
+            * self.scale
+            for statistic in ["count", "sum"]
+        ]
+        return self._smoothed_mean(
+            self.global_mean, count=count, mean=total / count
+        ).alias(feature)
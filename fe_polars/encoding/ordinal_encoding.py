@@ -0,0 +1,201 @@
+"""Ordinal encoding.
+
+Ordinal encoding replaces each category by an integer code, which is
+enough for tree based models. The codes are stored in the smallest
+unsigned integer dtype that can hold them.
+
+Some codes are reserved:
+
+- 0: null values
+- 1: unknown values, not seen at fit
+- 2: other values, seen at fit but beyond `max_categories`
+
+The categories seen at fit are numbered from 3, by decreasing frequency
+or in lexical order.
+"""
+from typing import Any, Dict, List, Optional, Union
+
+import polars
+
+from fe_polars.base import BaseTransformer
+from fe_polars.profile import DataProfile
+
+NULL_CODE = 0
+UNKNOWN_CODE = 1
+OTHER_CODE = 2
+_FIRST_CODE = 3
+
+
+def _is_string(dtype: polars.DataType) -> bool:
+    """Whether the feature holds strings, which can be cast to an Enum."""
+    return dtype == polars.Utf8 or isinstance(dtype, (polars.Categorical, polars.Enum))
+
+
+class OrdinalEncoder(BaseTransformer):
+    """Ordinal Encoder class."""
+
+    def __init__(
+        self,
+        features_to_encode: Union[str, List],
+        ordering: str = "frequency",
+        max_categories: Optional[int] = None,
+    ):
+        """Init.
+
+        Args:
+            features_to_encode (str | list): list of features to encode
+            ordering (str): frequency or lexical order of the codes
+            max_categories (int): number of most frequent categories to keep,
+                                  the others are encoded as other
+        """
+        self._params = {
+            "features_to_encode": features_to_encode,
+            "ordering": ordering,
+            "max_categories": max_categories,
+        }
+        if isinstance(features_to_encode, str):
+            features_to_encode = [features_to_encode]
+        orderings = ["frequency", "lexical"]
+        if ordering not in orderings:
+            raise ValueError(f"ordering must be one of {orderings}")
+        if max_categories is not None and max_categories < 1:
+            raise ValueError("max_categories must be positive")
+        self.features_to_encode = features_to_encode
+        self.ordering = ordering
+        self.max_categories = max_categories
+        self.mapping: Dict[str, Dict[str, Any]] = dict()
+
+    def fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.Series, polars.DataFrame]] = None,
+        profile: Optional[DataProfile] = None,
+    ) -> "OrdinalEncoder":
+        """Fit Ordinal Encoder.
+
+        The categories of all the features and their counts are computed in
+        one pass by feature.
+
+        Args:
+            x (polars.DataFrame): features table
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+            profile (DataProfile): profile of x (not used)
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=True)
+        schema = x.collect_schema()
+        counts = polars.collect_all(
+            [
+                x.lazy()
+                .select(polars.col(feature).drop_nulls())
+                .group_by(feature)
+                .agg(polars.len().alias("count"))
+                .sort(["count", feature], descending=[True, False])
+                for feature in self.features_to_encode
+            ]
+        )
+        for feature, feature_counts in zip(self.features_to_encode, counts):
+            categories = feature_counts[feature]
+            if _is_string(schema[feature]):
+                categories = categories.cast(polars.Utf8)
+            rare = categories.clear()
+            if self.max_categories is not None:
+                rare = categories[self.max_categories :]
+                categories = categories[: self.max_categories]
+            if self.ordering == "lexical":
+                categories = categories.sort()
+            self.mapping[feature] = {
+                "categories": categories.to_list(),
+                "rare": rare.to_list(),
+                "dtype": schema[feature],
+            }
+        return self
+
+    @staticmethod
+    def _code_dtype(n_categories: int) -> polars.DataType:
+        """Smallest unsigned integer dtype holding all the codes."""
+        max_code = _FIRST_CODE + n_categories - 1
+        if max_code < 2**8:
+            return polars.UInt8()
+        if max_code < 2**16:
+            return polars.UInt16()
+        return polars.UInt32()
+
+    def _encoding_expression(self, feature: str) -> polars.Expr:
+        """Build the expression replacing a feature by its codes.
+
+        String features are cast to a `polars.Enum` of their categories,
+        whose physical representation gives the codes. Other features are
+        looked up with `replace_strict`.
+
+        Args:
+            feature (str): feature to encode
+
+        Returns:
+            polars.Expr: encoding expression
+        """
+        mapping = self.mapping[feature]
+        categories, rare = mapping["categories"], mapping["rare"]
+        code_dtype = self._code_dtype(len(categories))
+        col = polars.col(feature)
+
+        if _is_string(mapping["dtype"]):
+            index = col.cast(polars.Enum(categories + rare), strict=False).to_physical()
+            code = (
+                polars.when(index.is_null())
+                .then(UNKNOWN_CODE)
+                .when(index < len(categories))
+                .then(index.cast(polars.UInt32) + _FIRST_CODE)
+                .otherwise(OTHER_CODE)
+            )
+        else:
+            code = col.cast(mapping["dtype"]).replace_strict(
+                categories + rare,
+                list(range(_FIRST_CODE, _FIRST_CODE + len(categories)))
+                + [OTHER_CODE] * len(rare),
+                default=UNKNOWN_CODE,
+            )
+        return (
+            polars.when(col.is_null())
+            .then(NULL_CODE)
+            .otherwise(code)
+            .cast(code_dtype)
+            .alias(feature)
+        )
+
+    def transform(self, x: Any) -> Any:
+        """Apply ordinal encoding to the provided dataframe.
+
+        A LazyFrame is transformed lazily and returned as a LazyFrame.
+
+        Args:
+            x (polars.DataFrame): features table to transform
+
+        Returns:
+            polars.DataFrame: transformed dataframe, in the format chosen
+                              with set_output
+        """
+        x = self._to_polars(x)
+        x = x.with_columns(
+            [self._encoding_expression(feature) for feature in self.mapping.keys()]
+        )
+        return self._to_output(x)
+
+    def fit_transform(
+        self,
+        x: Any,
+        y: Optional[Union[polars.Series, polars.DataFrame]] = None,
+    ) -> Any:
+        """Fit and apply ordinal encoding to the provided dataframe.
+
+        Args:
+            x (polars.DataFrame): features table to fit and transform
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+
+        Returns:
+            polars.DataFrame: transformed dataframe
+        """
+        self.fit(x=x, y=y)
+        return self.transform(x=x)
@@ -5,12 +5,16 @@ Target encoding is a technique used in data science to encode categorical variab
 It replaces each categorical value with the mean of the target variable for that value.
 """
 import logging
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import polars
 
+from fe_polars.base import BaseTransformer
+from fe_polars.monitoring import TransformMetrics
+from fe_polars.profile import DataProfile
 
-class TargetEncoder:
+
+class TargetEncoder(BaseTransformer):
     """Target Encoder class."""
 
     def __init__(self, smoothing: int, features_to_encode: Union[str, List]):
@@ -20,127 +24,206 @@ class TargetEncoder:
             smoothing (int): smoothing to apply
             features_to_encode (str | list): list of features to encode
         """
+        self._params = {
+            "smoothing": smoothing,
+            "features_to_encode": features_to_encode,
+        }
         if isinstance(features_to_encode, str):
             features_to_encode = [features_to_encode]
         self.smoothing = smoothing
         self.features_to_encode = features_to_encode
         self.global_mean: Union[int, float, None] = None
         self.mapping: Dict[str, Dict[str, Any]] = dict()
+        self.metrics = TransformMetrics()
 
-    def _check_features_unique_values(self, x: polars.DataFrame) -> None:
+    def _check_features_unique_values(self, profile: DataProfile) -> None:
         """Check if the features to impute are numerical.
 
         Args:
-            x (polars.DataFrame): feature dataset
+            profile (DataProfile): profile of the feature dataset
 
         Returns:
             None
         """
         for feature in self.features_to_encode:
-            pct_unique = x[feature].n_unique() / x.height
-            if pct_unique >= 0.5 and x[feature].dtype.is_numeric():
+            pct_unique = profile.n_unique[feature] / max(profile.height, 1)
+            if pct_unique >= 0.5 and profile.schema[feature].is_numeric():
                 logger = logging.getLogger(__name__)
                 logger.warning(f"Feature ['{feature}'] is possibly numerical")
 
+    def _smoothed_mean(
+        self,
+        global_mean: float,
+        count: Optional[polars.Expr] = None,
+        mean: Optional[polars.Expr] = None,
+    ) -> polars.Expr:
+        """Build the expression of the smoothed mean of each group.
+
+        Args:
+            global_mean (float): mean of the target
+            count (polars.Expr): count of each group, the count column if None
+            mean (polars.Expr): mean of each group, the mean column if None
+
+        Returns:
+            polars.Expr: smoothed mean computed from the count and mean
+        """
+        count = polars.col("count") if count is None else count
+        mean = polars.col("mean") if mean is None else mean
+        return (count * mean + self.smoothing * global_mean) / (count + self.smoothing)
+
     def fit(
-        self, x: polars.DataFrame, y: Union[polars.Series, polars.DataFrame]
+        self,
+        x: Any,
+        y: Any,
+        profile: Optional[DataProfile] = None,
     ) -> "TargetEncoder":
         """Fit the target encoder.
 
         Args:
-            x (polars.DataFrame): features table
+            x (polars.DataFrame): features table, or any input accepted by
+                                  BaseTransformer
             y (y: Union[polars.Series, polars.DataFrame]): target
+            profile (DataProfile): precomputed profile of x, computed if
+                                   None or if it misses some features
 
         Returns:
             self
         """
+        x = self._to_polars(x, reset=True)
+        y = self._target_to_polars(y)
+        self.metrics.reset()
+
         # Check if the features to impute are numerical and warn the user if not
-        self._check_features_unique_values(x)
+        if profile is None or not set(self.features_to_encode) <= set(profile.columns):
+            profile = DataProfile().fit(x.select(self.features_to_encode))
+        self._check_features_unique_values(profile)
 
         if isinstance(y, polars.DataFrame):
-            on = y.columns[0]
-        else:
-            on = y.name
-
-        x = x.with_columns(y)
-
-        # Compute the global mean
-        mean = x[on].mean()
-        self.global_mean = mean
+            y = y.to_series(0)
+        on = y.name
+        schema = x.collect_schema()
+        x = x.lazy().with_columns(y)
+
+        # Compute the global mean and the count and mean of each group in
+        # one pass, on a DataFrame or a LazyFrame
+        mean, *aggs = polars.collect_all(
+            [x.select(polars.col(on).mean())]
+            + [
+                x.group_by(feature).agg(
+                    [
+                        polars.len().alias("count").cast(polars.Float64),
+                        polars.col(on).mean().cast(polars.Float64).alias("mean"),
+                    ]
+                )
+                for feature in self.features_to_encode
+            ]
+        )
+        self.global_mean = mean.item()
 
-        for feature in self.features_to_encode:
-            # Compute the count and mean of each group
-            agg = x.group_by(feature).agg(
-                [
-                    polars.len().alias("count").cast(polars.Float64),
-                    polars.col(on).mean().cast(polars.Float64).alias("mean"),
-                ]
-            )
+        for feature, agg in zip(self.features_to_encode, aggs):
             # Compute the smoothed mean
             smooth = agg.with_columns(
-                encoding=(
-                    polars.col("count") * polars.col("mean")
-                    + self.smoothing * mean  # type: ignore
-                )
-                / (polars.col("count") + self.smoothing)
+                encoding=self._smoothed_mean(self.global_mean)  # type: ignore
             ).select([polars.col(feature), polars.col("encoding")])
             self.mapping[feature] = {
                 "table": smooth.to_dict(as_series=False),
-                "dtype": x.get_column(feature).dtype,
+                "dtype": schema[feature],
             }
         return self
 
-    def transform(self, x: polars.DataFrame) -> polars.DataFrame:
+    def _encoding_expression(self, feature: str) -> polars.Expr:
+        """Build the expression replacing a feature by its encoding.
+
+        Null and unseen values are replaced by null.
+
+        Args:
+            feature (str): feature to encode
+
+        Returns:
+            polars.Expr: encoding expression
+        """
+        dtype = self.mapping[feature]["dtype"]
+        mapping_table = (
+            polars.from_dict(self.mapping[feature]["table"])
+            .with_columns(polars.col(feature).cast(dtype))
+            .drop_nulls(feature)
+        )
+        return (
+            polars.col(feature)
+            .cast(dtype)
+            .replace_strict(
+                mapping_table[feature],
+                mapping_table["encoding"],
+                default=None,
+                return_dtype=polars.Float64,
+            )
+        )
+
+    def transform(self, x: Any) -> Any:
         """Apply the mapping to the provided dataframe.
 
+        A LazyFrame is transformed lazily and returned as a LazyFrame.
+        The null and unseen values of each feature are replaced by the global
+        mean and counted in `metrics`. LazyFrames and the data seen by
+        `fit_transform` are not counted.
+
         Args:
             x (polars.DataFrame): features table to transform
 
         Returns:
-            polars.DataFrame: transformed dataframe
+            polars.DataFrame: transformed dataframe, in the format chosen
+                              with set_output
         """
-        features_with_unseen = list()
+        x = self._to_polars(x)
+        schema = x.collect_schema()
         for feature in self.mapping.keys():
-            # Cast the mapping table
-            mapping_table = polars.from_dict(
-                self.mapping[feature]["table"]
-            ).with_columns(polars.col(feature).cast(self.mapping[feature]["dtype"]))
-
             # Enforce mapping dtype if different
-            if x[feature].dtype != self.mapping[feature]["dtype"]:
+            if schema[feature] != self.mapping[feature]["dtype"]:
                 logger = logging.getLogger(__name__)
                 logger.warning(
                     msg=(
                         f"Feature ['{feature}'] was mapped "
                         f"with dtype {self.mapping[feature]['dtype']} "
-                        f"not {x[feature].dtype}, "
+                        f"not {schema[feature]}, "
                         f"{self.mapping[feature]['dtype']} was enforced"
                     )
                 )
-                x = x.with_columns(
-                    polars.col(feature).cast(self.mapping[feature]["dtype"])
-                )
-
-            temp = x.join(mapping_table, on=feature, how="left")
-            x = x.with_columns(temp["encoding"].alias(feature)).select(x.columns)
-
-            # Handling of unseen data
-            # TODO: let user choose strategy
-            if x[feature].is_null().any():
-                features_with_unseen.append(feature)
-                x = x.with_columns(
-                    polars.col(feature).fill_null(self.global_mean).alias(feature)
-                )
-        if features_with_unseen:
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"{features_with_unseen} have unseen values, defaults to global mean"  # noqa: E501
-            )
-        return x
 
-    def fit_transform(
-        self, x: polars.DataFrame, y: Union[polars.Series, polars.DataFrame]
-    ) -> polars.DataFrame:
+        encoded = x.lazy().with_columns(
+            [self._encoding_expression(feature) for feature in self.mapping.keys()]
+        )
+        # Handling of unseen data
+        # TODO: let user choose strategy
+        fill_unseen = [
+            polars.col(feature).fill_null(self.global_mean)
+            for feature in self.mapping.keys()
+        ]
+        if isinstance(x, polars.LazyFrame):
+            return encoded.with_columns(fill_unseen)
+
+        # Both queries share the lookup, which is computed once
+        transformed, encoded_null_count = polars.collect_all(
+            [
+                encoded.with_columns(fill_unseen),
+                encoded.select(
+                    [polars.col(feature).null_count() for feature in self.mapping]
+                ),
+            ]
+        )
+        self.metrics.update(
+            rows=x.height,
+            counts={
+                feature: {
+                    "null": x[feature].null_count(),
+                    "unseen": encoded_null_count[feature].item()
+                    - x[feature].null_count(),
+                }
+                for feature in self.mapping.keys()
+            },
+        )
+        return self._to_output(transformed)
+
+    def fit_transform(self, x: Any, y: Any) -> Any:
         """Fit and apply the mapping to the provided dataframe.
 
         Args:
@@ -151,4 +234,7 @@ class TargetEncoder:
             polars.DataFrame: transformed dataframe
         """
         self.fit(x=x, y=y)
-        return self.transform(x=x)
+        transformed = self.transform(x=x)
+        # The training data is not a scored batch
+        self.metrics.reset()
+        return transformed
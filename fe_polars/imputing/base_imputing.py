@@ -8,13 +8,36 @@ with another value. You can choose between different strategies:
 - Max imputing: replace with the maximum value of the records.
 - Min imputing: replace with the minimum value of the records.
 - Fixed value imputing: replace with an arbitrary number.
+
+Ordered strategies fill the nulls from the neighbouring records, ordered by
+`order_by` and within each `partition_by` group (e.g. by device):
+
+- Forward fill imputing: replace with the previous non-null record.
+- Backward fill imputing: replace with the next non-null record.
+- Interpolate imputing: linear interpolation between the surrounding records,
+  by the value of the `order_by` feature (a single one), or by row position
+  without `order_by`.
+- Rolling mean imputing: replace with the mean of the non-null records in the
+  window of `window_size` records ending at the null record.
+
+They are compiled to window expressions, so all the features and partitions
+are imputed in one pass. The nulls they cannot fill, such as leading nulls,
+are replaced with the `fallback` statistic (mean by default).
 """
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import polars
 
+from fe_polars.base import BaseTransformer
+from fe_polars.monitoring import TransformMetrics
+from fe_polars.profile import DataProfile
+
+ORDERED_STRATEGIES = {"forward_fill", "backward_fill", "interpolate", "rolling_mean"}
+FALLBACK_STRATEGIES = {"mean", "median", "max", "min"}
+_NULL_COUNT = "__null_count__"
 
-class Imputer:
+
+class Imputer(BaseTransformer):
     """Imputer class.
 
     Impute a value in place of the null records in the dataframe
@@ -27,6 +50,12 @@ class Imputer:
                              (with "fixed_value" strategy)
         strategy_dict (dict): dictionnary describing strategies to apply
                               by feature
+        order_by (str | list): features ordering the records
+                               (with ordered strategies)
+        partition_by (str | list): features grouping the records
+                                   (with ordered strategies)
+        window_size (int): number of records of the rolling mean window
+        fallback (str): statistic imputed where ordered strategies cannot
     """
 
     def __init__(self, **kwargs):
@@ -39,19 +68,29 @@ class Imputer:
                 - strategy
                 - strategy_dict
                 - fixed_value
+                - order_by
+                - partition_by
+                - window_size
+                - fallback
         """
         valid_params = {
             "features_to_impute",
             "strategy",
             "strategy_dict",
             "fixed_value",
+            "order_by",
+            "partition_by",
+            "window_size",
+            "fallback",
         }
         valid_strategies = {"mean", "median", "max", "min", "fixed_value"}
+        valid_strategies |= ORDERED_STRATEGIES
 
         # Check that all provided parameters are valid
         for param_name in kwargs:
             if param_name not in valid_params:
                 raise ValueError(f"Invalid parameter '{param_name}' provided.")
+        self._params = dict(kwargs)
 
         # Check if kwargs are compatible together
         if "strategy_dict" in kwargs and (
@@ -69,7 +108,22 @@ class Imputer:
         self.strategy_dict = kwargs.get("strategy_dict", dict())
         self._fit_strategy_dict = False
         self.fixed_value = kwargs.get("fixed_value", None)
+        self.order_by = kwargs.get("order_by", list())
+        self.partition_by = kwargs.get("partition_by", list())
+        self.window_size = kwargs.get("window_size", 3)
+        self.fallback = kwargs.get("fallback", "mean")
         self.mapping = dict()
+        self.ordered_features: Dict[str, str] = dict()
+        self.metrics = TransformMetrics()
+
+        if isinstance(self.order_by, str):
+            self.order_by = [self.order_by]
+        if isinstance(self.partition_by, str):
+            self.partition_by = [self.partition_by]
+        if self.fallback not in FALLBACK_STRATEGIES:
+            raise ValueError(f"fallback must be one of {FALLBACK_STRATEGIES}")
+        if self.window_size < 1:
+            raise ValueError("window_size must be positive")
 
         if self.strategy:
             if self.strategy not in valid_strategies:
@@ -87,6 +141,9 @@ class Imputer:
         else:
             self._map_strategy_dict()
 
+        if "interpolate" in self.strategy_dict and len(self.order_by) > 1:
+            raise ValueError("interpolate strategy can only be ordered by one feature")
+
     def _check_strategy(self):
         """Check strategy to map the strategy_dict correctly."""
         if self.strategy is None and self.fixed_value is None:
@@ -119,82 +176,205 @@ class Imputer:
 
         self.strategy_dict = {_strategy: _feature_to_impute}
 
-    def _process_strategy(self, strategy, feature, x):
-        """Process the different strategy by feature."""
-        STRATEGY_FUNCTIONS = {
-            "mean": getattr(polars.DataFrame, "mean"),
-            "median": getattr(polars.DataFrame, "median"),
-            "max": getattr(polars.DataFrame, "max"),
-            "min": getattr(polars.DataFrame, "min"),
-        }
-        # Apply the corresponding function based on the strategy
-        if strategy != "fixed_value":
-            if isinstance(x.select(feature), polars.DataFrame):
-                self.mapping[feature] = STRATEGY_FUNCTIONS[strategy](
-                    x.select(feature)
-                ).item()
+    def _strategy_expression(self, strategy, feature, profile):
+        """Build the expression computing the value to impute for a feature.
+
+        Min and max are read from the profile when it covers all the rows.
+        """
+        if strategy in ["min", "max"] and profile is not None and not profile.sampled:
+            return polars.lit(getattr(profile, strategy)[feature])
+        return getattr(polars.col(feature), strategy)()
+
+    def _ordered_expression(self, strategy: str, feature: str) -> polars.Expr:
+        """Build the window expression of an ordered strategy.
+
+        The records are sorted by `order_by` inside the expression and put
+        back in their original order, within each `partition_by` group.
+        """
+        col = polars.col(feature)
+        if self.order_by:
+            order = polars.arg_sort_by(self.order_by)
+            col = col.gather(order)
+
+        if strategy == "forward_fill":
+            filled = col.forward_fill()
+        elif strategy == "backward_fill":
+            filled = col.backward_fill()
+        elif strategy == "interpolate" and self.order_by:
+            filled = col.interpolate_by(polars.col(self.order_by[0]).gather(order))
+        elif strategy == "interpolate":
+            filled = col.interpolate()
         else:
-            self.mapping[feature] = self.strategy_dict["fixed_value"][feature]
+            # The mean of the shifted records is exact, skips the nulls and
+            # gives null for a window without values
+            filled = col.fill_null(
+                polars.mean_horizontal([col.shift(i) for i in range(self.window_size)])
+            )
+
+        if self.order_by:
+            filled = filled.gather(order.arg_sort())
+        if self.partition_by:
+            filled = filled.over(self.partition_by)
+        return filled
+
+    def _fill_expression(self, feature: str) -> polars.Expr:
+        """Build the expression imputing the nulls of a feature."""
+        value = polars.lit(self.mapping[feature])
+        if feature not in self.ordered_features:
+            return polars.col(feature).fill_null(value)
+        strategy = self.ordered_features[feature]
+        return (
+            self._ordered_expression(strategy, feature).fill_null(value).alias(feature)
+        )
 
     def fit(
         self,
-        x: polars.DataFrame,
+        x: Any,
         y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+        profile: Optional[DataProfile] = None,
     ) -> "Imputer":
         """Fit.
 
+        The statistics of all the features are computed in one pass, on a
+        DataFrame or a LazyFrame.
+
         Args:
             x (polars.DataFrame): feature dataset
             y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+            profile (DataProfile): precomputed profile of x, not used if
+                                   it misses some features
 
         Returns:
             self
         """
+        x = self._to_polars(x, reset=True)
+        self.metrics.reset()
+        self.mapping = dict()
+        self.ordered_features = dict()
+        schema = x.collect_schema()
+        if self._fit_strategy_dict:
+            features = [col for col in schema.names() if schema[col].is_numeric()]
+        else:
+            features = [
+                feature
+                for strategy in self.strategy_dict.keys()
+                for feature in self.strategy_dict[strategy]
+            ]
+        if profile is not None and not set(features) <= set(profile.columns):
+            profile = None
+
         # If no strategy dictionnary has been provided and neither was a list of feature
         # to impute, then we apply the strategy on all the columns that contain
-        # null values
+        # null values. A sampled profile can miss nulls, they are counted exactly
+        # with the statistics instead.
+        count_nulls = self._fit_strategy_dict and (profile is None or profile.sampled)
         if self._fit_strategy_dict:
             self.features_to_impute = [
-                col
-                for col in x.columns
-                if x[col].is_null().any() and x[col].dtype.is_numeric()
+                col for col in features if count_nulls or profile.has_nulls(col)
             ]
             self._map_strategy_dict()
 
+        # Compute the statistics of all the features in one pass
+        expressions = list()
         for strategy in self.strategy_dict.keys():
             for feature in self.strategy_dict[strategy]:
-                if not x[feature].dtype.is_numeric():
+                if not schema[feature].is_numeric():
                     raise ValueError(f"{feature} is not a numerical feature")
-                self._process_strategy(strategy, feature, x)
+                if count_nulls:
+                    expressions.append(
+                        polars.col(feature)
+                        .null_count()
+                        .alias(f"{_NULL_COUNT}{feature}")
+                    )
+                if strategy == "fixed_value":
+                    self.mapping[feature] = self.strategy_dict["fixed_value"][feature]
+                elif strategy in ORDERED_STRATEGIES:
+                    # The fallback statistic fills what the strategy cannot
+                    self.ordered_features[feature] = strategy
+                    expressions.append(
+                        self._strategy_expression(
+                            self.fallback, feature, profile
+                        ).alias(feature)
+                    )
+                else:
+                    expressions.append(
+                        self._strategy_expression(strategy, feature, profile).alias(
+                            feature
+                        )
+                    )
+        statistics = dict()
+        if expressions:
+            statistics = x.lazy().select(expressions).collect().row(0, named=True)
+
+        if count_nulls:
+            self.features_to_impute = [
+                col for col in features if statistics[f"{_NULL_COUNT}{col}"] > 0
+            ]
+            self._map_strategy_dict()
+            statistics = {
+                col: value
+                for col, value in statistics.items()
+                if col in self.features_to_impute
+            }
+            self.mapping = {
+                col: value
+                for col, value in self.mapping.items()
+                if col in self.features_to_impute
+            }
+            self.ordered_features = {
+                col: strategy
+                for col, strategy in self.ordered_features.items()
+                if col in self.features_to_impute
+            }
+        self.mapping.update(statistics)
 
         return self
 
-    def transform(self, x: polars.DataFrame) -> polars.DataFrame:
+    def transform(self, x: Any) -> Any:
         """Transform.
 
+        A LazyFrame is transformed lazily and returned as a LazyFrame.
+        The imputed nulls of each feature are counted in `metrics`,
+        LazyFrames and the data seen by `fit_transform` are not counted.
+
         Args:
             x (polars.DataFrame): feature dataset
 
         Returns:
-            polars.DataFrame: transformed dataset
+            polars.DataFrame: transformed dataset, in the format chosen
+                              with set_output
         """
-        for feature in self.mapping.keys():
-            x = x.with_columns(
-                polars.col(feature).fill_null(
-                    polars.lit(self.mapping[feature]),
-                )
+        x = self._to_polars(x)
+        if isinstance(x, polars.DataFrame):
+            # Null counts are stored with the columns, no scan is needed
+            self.metrics.update(
+                rows=x.height,
+                counts={
+                    feature: {"imputed": x[feature].null_count()}
+                    for feature in self.mapping.keys()
+                },
             )
-        return x
+        x = x.with_columns(
+            [self._fill_expression(feature) for feature in self.mapping.keys()]
+        )
+        return self._to_output(x)
 
-    def fit_transform(self, x: polars.DataFrame) -> polars.DataFrame:
+    def fit_transform(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+    ) -> Any:
         """Fit & transform.
 
         Args:
             x (polars.DataFrame): feature dataset
-            features_list (list): list of features to mean impute
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
 
         Returns:
             polars.DataFrame: transformed dataset
         """
         self.fit(x=x)
-        return self.transform(x=x)
+        transformed = self.transform(x=x)
+        # The training data is not a scored batch
+        self.metrics.reset()
+        return transformed
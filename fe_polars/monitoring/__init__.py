@@ -0,0 +1,3 @@
+from .transform_metrics import TransformMetrics
+
+__all__ = ["TransformMetrics"]
@@ -0,0 +1,78 @@
+"""Transform metrics.
+
+Counters filled by the transformers while they transform data, such as
+the number of unseen categories or of imputed nulls by feature. They are
+kept for the last batch and accumulated over all the batches, and can be
+scraped with `to_dict` for drift monitoring.
+"""
+from typing import Dict
+
+
+class TransformMetrics:
+    """Transform Metrics class.
+
+    Attributes:
+        n_batches (int): number of batches transformed
+        rows (int): number of rows transformed
+        counts (dict): cumulative counts by feature
+        last_batch (dict): counts of the last batch by feature
+    """
+
+    def __init__(self):
+        """Init."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all the counters."""
+        self.n_batches = 0
+        self.rows = 0
+        self.last_batch_rows = 0
+        self.counts: Dict[str, Dict[str, int]] = dict()
+        self.last_batch: Dict[str, Dict[str, int]] = dict()
+
+    def update(self, rows: int, counts: Dict[str, Dict[str, int]]) -> None:
+        """Record the counts of a transformed batch.
+
+        Args:
+            rows (int): number of rows of the batch
+            counts (dict): counts by feature, e.g. {"City": {"unseen": 3}}
+        """
+        self.n_batches += 1
+        self.rows += rows
+        self.last_batch_rows = rows
+        self.last_batch = counts
+        for feature, feature_counts in counts.items():
+            cumulative = self.counts.setdefault(feature, dict())
+            for name, count in feature_counts.items():
+                cumulative[name] = cumulative.get(name, 0) + count
+
+    @staticmethod
+    def _rates(
+        counts: Dict[str, Dict[str, int]], rows: int
+    ) -> Dict[str, Dict[str, float]]:
+        """Divide the counts by the number of rows."""
+        return {
+            feature: {
+                f"{name}_rate": count / rows if rows else 0.0
+                for name, count in feature_counts.items()
+            }
+            for feature, feature_counts in counts.items()
+        }
+
+    def to_dict(self) -> Dict:
+        """Export the counts and rates, cumulative and of the last batch.
+
+        Returns:
+            dict: metrics
+        """
+        return {
+            "n_batches": self.n_batches,
+            "rows": self.rows,
+            "counts": self.counts,
+            "rates": self._rates(self.counts, self.rows),
+            "last_batch": {
+                "rows": self.last_batch_rows,
+                "counts": self.last_batch,
+                "rates": self._rates(self.last_batch, self.last_batch_rows),
+            },
+        }
@@ -0,0 +1,152 @@
+"""Pipeline.
+
+A pipeline chains transformers. The data is profiled once at fit time and
+the profile is shared with every step, so the steps do not scan the data
+again for their fit-time checks.
+"""
+from typing import Any, List, Optional, Union
+
+import polars
+
+from fe_polars.base import BaseTransformer
+from fe_polars.monitoring import TransformMetrics
+from fe_polars.profile import DataProfile
+
+
+class Pipeline(BaseTransformer):
+    """Pipeline class.
+
+    Fit and apply a list of transformers one after the other.
+
+    Args:
+        steps (list): transformers to chain
+        sample_fraction (float): fraction of the rows to profile
+        seed (int): seed used when sampling
+    """
+
+    def __init__(
+        self,
+        steps: List[Any],
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """Init.
+
+        Args:
+            steps (list): transformers to chain
+            sample_fraction (float): fraction of the rows to profile,
+                                     profile all the rows if None
+            seed (int): seed used when sampling
+        """
+        self._params = {
+            "steps": steps,
+            "sample_fraction": sample_fraction,
+            "seed": seed,
+        }
+        self.steps = steps
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.profile: Optional[DataProfile] = None
+
+    @staticmethod
+    def _stale_columns(
+        step: Any,
+        profile: DataProfile,
+        x: Union[polars.DataFrame, polars.LazyFrame],
+    ) -> List[str]:
+        """Columns of the profile that no longer describe the data.
+
+        Those are the columns dropped or cast by the step and the columns
+        it fitted a mapping for.
+        """
+        mapping = getattr(step, "mapping", dict())
+        schema = x.collect_schema()
+        return [
+            column
+            for column in profile.columns
+            if column not in schema
+            or schema[column] != profile.schema[column]
+            or column in mapping
+        ]
+
+    def _reset_metrics(self) -> None:
+        """Forget the training data counted by the steps while fitting."""
+        for step in self.steps:
+            metrics = getattr(step, "metrics", None)
+            if isinstance(metrics, TransformMetrics):
+                metrics.reset()
+
+    def get_feature_names_out(
+        self, input_features: Optional[List[str]] = None
+    ) -> List[str]:
+        """Get the names of the output features of the last step.
+
+        Args:
+            input_features (list): not used, the names seen at fit are used
+
+        Returns:
+            list: names of the columns returned by transform
+        """
+        return self.steps[-1].get_feature_names_out(input_features)
+
+    def fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.Series, polars.DataFrame]] = None,
+    ) -> "Pipeline":
+        """Fit all the steps.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=True)
+        y = None if y is None else self._target_to_polars(y)
+        self.profile = DataProfile(
+            sample_fraction=self.sample_fraction, seed=self.seed
+        ).fit(x)
+        profile = self.profile
+        for i, step in enumerate(self.steps):
+            step.fit(x, y, profile=profile)
+            if i < len(self.steps) - 1:
+                x = self._to_polars(step.transform(x))
+                profile = profile.drop(self._stale_columns(step, profile, x))
+        self._reset_metrics()
+        return self
+
+    def transform(self, x: Any) -> Any:
+        """Apply all the steps.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+
+        Returns:
+            polars.DataFrame: transformed dataset, in the format chosen
+                              with set_output
+        """
+        x = self._to_polars(x)
+        for step in self.steps:
+            x = step.transform(x)
+        return self._to_output(self._to_polars(x))
+
+    def fit_transform(
+        self,
+        x: Any,
+        y: Optional[Union[polars.Series, polars.DataFrame]] = None,
+    ) -> Any:
+        """Fit & transform.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target
+
+        Returns:
+            polars.DataFrame: transformed dataset
+        """
+        self.fit(x=x, y=y)
+        transformed = self.transform(x=x)
+        self._reset_metrics()
+        return transformed
@@ -0,0 +1,3 @@
+from .data_profile import DataProfile
+
+__all__ = ["DataProfile"]
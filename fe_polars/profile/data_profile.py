@@ -0,0 +1,128 @@
+"""Data profiling.
+
+A data profile gathers the statistics the transformers need at fit time
+(null counts, approximate distinct counts, min/max and dtypes) for every
+column in a single lazy query, so that they do not have to scan the data
+again for their own checks.
+
+The profile can be computed on a sample of the data for very large inputs.
+In that case the counts describe the sample and not the full dataset.
+"""
+from typing import Any, Dict, List, Optional, Union
+
+import polars
+
+from fe_polars.profile.sampling import check_sample_fraction, sample_rows
+
+_SEPARATOR = "__"
+
+
+class DataProfile:
+    """Data Profile class.
+
+    Compute null counts, approximate distinct counts, min/max and dtypes
+    for all the columns of a dataframe in one pass.
+
+    Args:
+        sample_fraction (float): fraction of the rows to profile
+        seed (int): seed used when sampling
+    """
+
+    def __init__(
+        self,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """Init.
+
+        Args:
+            sample_fraction (float): fraction of the rows to profile,
+                                     profile all the rows if None
+            seed (int): seed used when sampling a DataFrame
+        """
+        check_sample_fraction(sample_fraction)
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.height: int = 0
+        self.schema: Dict[str, polars.DataType] = dict()
+        self.null_count: Dict[str, int] = dict()
+        self.n_unique: Dict[str, int] = dict()
+        self.min: Dict[str, Any] = dict()
+        self.max: Dict[str, Any] = dict()
+
+    @property
+    def sampled(self) -> bool:
+        """Whether the profile was computed on a sample of the rows."""
+        return self.sample_fraction is not None and self.sample_fraction < 1
+
+    @property
+    def columns(self) -> List[str]:
+        """Profiled columns."""
+        return list(self.schema.keys())
+
+    def fit(self, x: Union[polars.DataFrame, polars.LazyFrame]) -> "DataProfile":
+        """Compute the profile.
+
+        Args:
+            x (polars.DataFrame | polars.LazyFrame): dataset to profile
+
+        Returns:
+            self
+        """
+        lazy = sample_rows(x, self.sample_fraction, self.seed)
+        self.schema = dict(lazy.collect_schema())
+
+        expressions = [polars.len().alias("len")]
+        for column, dtype in self.schema.items():
+            col = polars.col(column)
+            expressions += [
+                col.null_count().alias(f"null_count{_SEPARATOR}{column}"),
+                col.approx_n_unique().alias(f"n_unique{_SEPARATOR}{column}"),
+            ]
+            if dtype.is_numeric() or dtype.is_temporal():
+                expressions += [
+                    col.min().alias(f"min{_SEPARATOR}{column}"),
+                    col.max().alias(f"max{_SEPARATOR}{column}"),
+                ]
+        row = lazy.select(expressions).collect().row(0, named=True)
+
+        self.height = row.pop("len")
+        self.null_count, self.n_unique, self.min, self.max = {}, {}, {}, {}
+        for key, value in row.items():
+            statistic, column = key.split(_SEPARATOR, 1)
+            getattr(self, statistic)[column] = value
+        return self
+
+    def has_nulls(self, column: str) -> bool:
+        """Whether the column contains null values.
+
+        Args:
+            column (str): column name
+
+        Returns:
+            bool: True if at least one null value was found
+        """
+        return self.null_count[column] > 0
+
+    def drop(self, columns: List[str]) -> "DataProfile":
+        """Return a copy of the profile without the provided columns.
+
+        Args:
+            columns (list): columns to remove from the profile
+
+        Returns:
+            DataProfile: profile of the remaining columns
+        """
+        profile = DataProfile(sample_fraction=self.sample_fraction, seed=self.seed)
+        profile.height = self.height
+        for attribute in ["schema", "null_count", "n_unique", "min", "max"]:
+            setattr(
+                profile,
+                attribute,
+                {
+                    column: value
+                    for column, value in getattr(self, attribute).items()
+                    if column not in columns
+                },
+            )
+        return profile
@@ -0,0 +1,48 @@
+"""Row sampling.
+
+The profile and the transformers approximating quantiles can compute
+their statistics on a sample of the rows for very large inputs. The rows
+are sampled once, so that all the statistics describe the same sample.
+"""
+from typing import Optional, Union
+
+import polars
+
+
+def check_sample_fraction(sample_fraction: Optional[float]) -> None:
+    """Check that the sample fraction is None or in (0, 1].
+
+    Args:
+        sample_fraction (float): fraction of the rows to sample
+
+    Returns:
+        None
+    """
+    if sample_fraction is not None and not 0 < sample_fraction <= 1:
+        raise ValueError("sample_fraction must be in (0, 1]")
+
+
+def sample_rows(
+    x: Union[polars.DataFrame, polars.LazyFrame],
+    sample_fraction: Optional[float],
+    seed: Optional[int] = None,
+) -> polars.LazyFrame:
+    """Sample the rows of a dataframe.
+
+    LazyFrames cannot be randomly sampled without being collected,
+    every n-th row is taken instead.
+
+    Args:
+        x (polars.DataFrame | polars.LazyFrame): dataframe to sample
+        sample_fraction (float): fraction of the rows to sample,
+                                 all the rows if None
+        seed (int): seed used when sampling a DataFrame
+
+    Returns:
+        polars.LazyFrame: sampled rows
+    """
+    if sample_fraction is None or sample_fraction >= 1:
+        return x.lazy()
+    if isinstance(x, polars.DataFrame):
+        return x.sample(fraction=sample_fraction, seed=seed).lazy()
+    return x.gather_every(max(1, round(1 / sample_fraction)))
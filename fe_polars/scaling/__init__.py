@@ -0,0 +1,5 @@
+from .min_max_scaling import MinMaxScaler
+from .robust_scaling import RobustScaler
+from .standard_scaling import StandardScaler
+
+__all__ = ["StandardScaler", "MinMaxScaler", "RobustScaler"]
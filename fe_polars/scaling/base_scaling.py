@@ -0,0 +1,156 @@
+"""Base scaling.
+
+Scaling transforms numerical features to a common scale. The statistics
+of all the features are computed in one `select` at fit time and the
+transform is a single `with_columns` of arithmetic expressions, so both
+work on DataFrames and LazyFrames.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+import polars
+
+from fe_polars.base import BaseTransformer
+from fe_polars.profile import DataProfile
+
+
+class BaseScaler(BaseTransformer, ABC):
+    """Base Scaler class.
+
+    Subclasses define the statistics to compute by feature and the scaling
+    expression built from them.
+    """
+
+    def __init__(self, features_to_scale: Union[str, List]):
+        """Init.
+
+        Args:
+            features_to_scale (str | list): list of features to scale
+        """
+        if isinstance(features_to_scale, str):
+            features_to_scale = [features_to_scale]
+        self.features_to_scale = features_to_scale
+        self.mapping: Dict[str, Dict[str, Any]] = dict()
+
+    @abstractmethod
+    def _statistics(self, feature: str, profile: Optional[DataProfile]) -> polars.Expr:
+        """Build the struct expression of the statistics of a feature."""
+
+    @abstractmethod
+    def _scaling_expression(self, feature: str) -> polars.Expr:
+        """Build the expression scaling a feature."""
+
+    @abstractmethod
+    def _merge_statistics(
+        self, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge the statistics of two batches of data."""
+
+    def _compute_statistics(
+        self,
+        x: Union[polars.DataFrame, polars.LazyFrame],
+        profile: Optional[DataProfile] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute the statistics of all the features in one pass.
+
+        Args:
+            x (polars.DataFrame | polars.LazyFrame): feature dataset
+            profile (DataProfile): precomputed profile of x
+
+        Returns:
+            dict: statistics by feature
+        """
+        schema = x.collect_schema()
+        for feature in self.features_to_scale:
+            if not schema[feature].is_numeric():
+                raise ValueError(f"{feature} is not a numerical feature")
+        return (
+            x.lazy()
+            .select(
+                [
+                    self._statistics(feature, profile).alias(feature)
+                    for feature in self.features_to_scale
+                ]
+            )
+            .collect()
+            .row(0, named=True)
+        )
+
+    def fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+        profile: Optional[DataProfile] = None,
+    ) -> "BaseScaler":
+        """Fit.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+            profile (DataProfile): precomputed profile of x
+
+        Returns:
+            self
+        """
+        x = self._to_polars(x, reset=True)
+        self.mapping = self._compute_statistics(x, profile)
+        return self
+
+    def partial_fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+    ) -> "BaseScaler":
+        """Update the statistics with a new batch of data.
+
+        Args:
+            x (polars.DataFrame): batch of the feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+
+        Returns:
+            self
+        """
+        if not self.mapping:
+            return self.fit(x=x)
+        x = self._to_polars(x)
+        statistics = self._compute_statistics(x)
+        for feature in self.features_to_scale:
+            self.mapping[feature] = self._merge_statistics(
+                self.mapping[feature], statistics[feature]
+            )
+        return self
+
+    def transform(self, x: Any) -> Any:
+        """Transform.
+
+        A LazyFrame is transformed lazily and returned as a LazyFrame.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+
+        Returns:
+            polars.DataFrame: transformed dataset, in the format chosen
+                              with set_output
+        """
+        x = self._to_polars(x)
+        x = x.with_columns(
+            [self._scaling_expression(feature) for feature in self.mapping.keys()]
+        )
+        return self._to_output(x)
+
+    def fit_transform(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+    ) -> Any:
+        """Fit & transform.
+
+        Args:
+            x (polars.DataFrame): feature dataset
+            y (y: Union[polars.Series, polars.DataFrame]): target (not used)
+
+        Returns:
+            polars.DataFrame: transformed dataset
+        """
+        self.fit(x=x)
+        return self.transform(x=x)
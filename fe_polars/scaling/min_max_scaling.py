@@ -0,0 +1,75 @@
+"""Min-max scaling.
+
+Min-max scaling maps each feature linearly from its [min, max] range to
+a chosen range, [0, 1] by default. Minimums and maximums of new batches
+are merged with `partial_fit`.
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import polars
+
+from fe_polars.profile import DataProfile
+from fe_polars.scaling.base_scaling import BaseScaler
+
+
+class MinMaxScaler(BaseScaler):
+    """Min Max Scaler class."""
+
+    def __init__(
+        self,
+        features_to_scale: Union[str, List],
+        feature_range: Tuple[float, float] = (0, 1),
+    ):
+        """Init.
+
+        Args:
+            features_to_scale (str | list): list of features to scale
+            feature_range (tuple): range of the scaled features
+        """
+        self._params = {
+            "features_to_scale": features_to_scale,
+            "feature_range": feature_range,
+        }
+        if feature_range[0] >= feature_range[1]:
+            raise ValueError("feature_range minimum must be lower than its maximum")
+        super().__init__(features_to_scale=features_to_scale)
+        self.feature_range = feature_range
+
+    def _statistics(self, feature: str, profile: Optional[DataProfile]) -> polars.Expr:
+        """Build the struct expression of the min and max of a feature.
+
+        They are read from the profile when it covers all the rows.
+        """
+        if profile is not None and not profile.sampled and feature in profile.min:
+            return polars.struct(
+                min=polars.lit(profile.min[feature]),
+                max=polars.lit(profile.max[feature]),
+            )
+        return polars.struct(
+            min=polars.col(feature).min(), max=polars.col(feature).max()
+        )
+
+    def _merge_statistics(
+        self, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge the min and max of two batches."""
+        return {
+            "min": min(
+                [v for v in [old["min"], new["min"]] if v is not None], default=None
+            ),
+            "max": max(
+                [v for v in [old["max"], new["max"]] if v is not None], default=None
+            ),
+        }
+
+    def _scaling_expression(self, feature: str) -> polars.Expr:
+        """Build the expression scaling a feature to the feature range.
+
+        A constant feature is mapped to the lower bound of the range.
+        """
+        statistics = self.mapping[feature]
+        if statistics["min"] is None:
+            return polars.col(feature)
+        low, high = self.feature_range
+        scale = (high - low) / ((statistics["max"] - statistics["min"]) or 1.0)
+        return (polars.col(feature) - statistics["min"]) * scale + low
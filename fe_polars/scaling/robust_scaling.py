@@ -0,0 +1,103 @@
+"""Robust scaling.
+
+Robust scaling centers each feature on its median and divides it by its
+interquartile range, which makes it robust to outliers. The quantiles can
+be approximated on a sample of the rows for large datasets. Quantiles
+cannot be merged, `partial_fit` is not supported.
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import polars
+
+from fe_polars.profile import DataProfile
+from fe_polars.profile.sampling import check_sample_fraction, sample_rows
+from fe_polars.scaling.base_scaling import BaseScaler
+
+_NO_PARTIAL_FIT = (
+    "RobustScaler does not support partial_fit: the quantiles of "
+    "several batches cannot be merged, fit it on the whole dataset"
+)
+
+
+class RobustScaler(BaseScaler):
+    """Robust Scaler class."""
+
+    def __init__(
+        self,
+        features_to_scale: Union[str, List],
+        quantile_range: Tuple[float, float] = (25.0, 75.0),
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """Init.
+
+        Args:
+            features_to_scale (str | list): list of features to scale
+            quantile_range (tuple): quantiles (in percent) of the range
+            sample_fraction (float): fraction of the rows used to
+                                     approximate the quantiles,
+                                     exact quantiles if None
+            seed (int): seed used when sampling
+        """
+        self._params = {
+            "features_to_scale": features_to_scale,
+            "quantile_range": quantile_range,
+            "sample_fraction": sample_fraction,
+            "seed": seed,
+        }
+        if not 0 <= quantile_range[0] < quantile_range[1] <= 100:
+            raise ValueError("quantile_range must be increasing within [0, 100]")
+        check_sample_fraction(sample_fraction)
+        super().__init__(features_to_scale=features_to_scale)
+        self.quantile_range = quantile_range
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+
+    def _compute_statistics(
+        self,
+        x: Union[polars.DataFrame, polars.LazyFrame],
+        profile: Optional[DataProfile] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute the quantiles of all the features on one sample of the rows."""
+        return super()._compute_statistics(
+            sample_rows(x, self.sample_fraction, self.seed), profile
+        )
+
+    def _statistics(self, feature: str, profile: Optional[DataProfile]) -> polars.Expr:
+        """Build the struct expression of the median and quantiles of a feature."""
+        col = polars.col(feature)
+        low, high = self.quantile_range
+        return polars.struct(
+            median=col.median(),
+            low=col.quantile(low / 100, interpolation="linear"),
+            high=col.quantile(high / 100, interpolation="linear"),
+        )
+
+    def partial_fit(
+        self,
+        x: Any,
+        y: Optional[Union[polars.DataFrame, polars.Series]] = None,
+    ) -> "RobustScaler":
+        """Refuse to update the quantiles with a new batch of data.
+
+        Raises:
+            ValueError: always, the quantiles of two batches cannot be merged
+        """
+        raise ValueError(_NO_PARTIAL_FIT)
+
+    def _merge_statistics(
+        self, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Refuse to merge quantiles, see `partial_fit`."""
+        raise ValueError(_NO_PARTIAL_FIT)
+
+    def _scaling_expression(self, feature: str) -> polars.Expr:
+        """Build the expression scaling a feature.
+
+        A feature with a null interquartile range is only centered.
+        """
+        statistics = self.mapping[feature]
+        if statistics["median"] is None:
+            return polars.col(feature)
+        scale = (statistics["high"] - statistics["low"]) or 1.0
+        return (polars.col(feature) - statistics["median"]) / scale
@@ -0,0 +1,65 @@
+"""Standard scaling.
+
+Standard scaling centers each feature on its mean and divides it by its
+standard deviation. The count, mean and sum of squared deviations are
+kept so that the statistics of new batches can be merged with
+`partial_fit`.
+"""
+import math
+from typing import Any, Dict, List, Optional, Union
+
+import polars
+
+from fe_polars.profile import DataProfile
+from fe_polars.scaling.base_scaling import BaseScaler
+
+
+class StandardScaler(BaseScaler):
+    """Standard Scaler class."""
+
+    def __init__(self, features_to_scale: Union[str, List]):
+        """Init.
+
+        Args:
+            features_to_scale (str | list): list of features to scale
+        """
+        self._params = {"features_to_scale": features_to_scale}
+        super().__init__(features_to_scale=features_to_scale)
+
+    def _statistics(self, feature: str, profile: Optional[DataProfile]) -> polars.Expr:
+        """Build the struct expression of the count, mean and m2 of a feature."""
+        col = polars.col(feature)
+        return polars.struct(
+            count=col.count(),
+            mean=col.mean(),
+            m2=col.var(ddof=0) * col.count(),
+        )
+
+    def _merge_statistics(
+        self, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge the moments of two batches (Chan et al. parallel algorithm)."""
+        if not new["count"]:
+            return old
+        if not old["count"]:
+            return new
+        count = old["count"] + new["count"]
+        delta = new["mean"] - old["mean"]
+        return {
+            "count": count,
+            "mean": old["mean"] + delta * new["count"] / count,
+            "m2": old["m2"]
+            + new["m2"]
+            + delta**2 * old["count"] * new["count"] / count,
+        }
+
+    def _scaling_expression(self, feature: str) -> polars.Expr:
+        """Build the expression standardizing a feature.
+
+        A feature with a null standard deviation is only centered.
+        """
+        statistics = self.mapping[feature]
+        if not statistics["count"]:
+            return polars.col(feature)
+        std = math.sqrt(statistics["m2"] / statistics["count"]) or 1.0
+        return (polars.col(feature) - statistics["mean"]) / std
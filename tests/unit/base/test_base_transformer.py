@@ -0,0 +1,158 @@
+"""Test Base Transformer."""
+import math
+
+import polars
+import pytest
+
+from fe_polars.encoding import OneHotEncoder, TargetEncoder
+from fe_polars.imputing import Imputer
+from fe_polars.pipeline import Pipeline
+
+
+def test_get_set_params():
+    """Test the scikit-learn parameters protocol.
+
+    - Assert that the parameters are the ones provided at init
+    - Assert that setting a parameter reinitializes the transformer
+    """
+    imputer = Imputer(features_to_impute="Rain", strategy="max")
+    encoder = TargetEncoder(smoothing=1, features_to_encode="City")
+
+    assert imputer.get_params() == {"features_to_impute": "Rain", "strategy": "max"}
+    assert encoder.set_params(smoothing=25).smoothing == 25
+    assert encoder.features_to_encode == ["City"]
+
+
+def test_bad_output():
+    """Test if a wrong output container is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = Imputer().set_output(transform="bad-output")
+    assert "transform must be one of" in str(excinfo.value)
+
+
+def test_get_feature_names_out(standard_polars_dataframe):
+    """Test the output feature names."""
+    imputer = Imputer(features_to_impute="Rain").fit(standard_polars_dataframe)
+    encoder = OneHotEncoder(features_to_encode="City").fit(standard_polars_dataframe)
+
+    assert imputer.get_feature_names_out() == ["City", "Temperature", "Rain"]
+    assert encoder.get_feature_names_out() == [
+        "Temperature",
+        "Rain",
+        "City_A",
+        "City_B",
+        "City_C",
+    ]
+    assert encoder.transform(standard_polars_dataframe).columns == (
+        encoder.get_feature_names_out()
+    )
+
+
+def test_arrow_input_output(with_numerical_nulls_polars_dataframe):
+    """Test pyarrow tables and record batches in and out."""
+    pyarrow = pytest.importorskip("pyarrow")
+    table = with_numerical_nulls_polars_dataframe.to_arrow()
+
+    imputer = Imputer(features_to_impute="Rain").set_output(transform="arrow")
+    result = imputer.fit(table).transform(table.to_batches()[0])
+
+    assert isinstance(result, pyarrow.Table)
+    assert result.column("Rain").null_count == 0
+
+
+def test_numpy_input_output():
+    """Test NumPy arrays in and out, NaN being considered as missing."""
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array([[1.0, numpy.nan], [2.0, 3.0], [3.0, 5.0]])
+
+    imputer = Imputer(strategy="mean").set_output(transform="numpy")
+    result = imputer.fit_transform(array)
+
+    assert result.flags["F_CONTIGUOUS"]
+    assert math.isclose(result[0, 1], 4.0)
+    assert imputer.get_feature_names_out() == ["column_0", "column_1"]
+
+
+def test_numpy_input_width():
+    """Test that an array of another width than at fit is refused."""
+    numpy = pytest.importorskip("numpy")
+    imputer = Imputer(strategy="mean").fit(numpy.array([[1.0, numpy.nan], [2, 3]]))
+
+    with pytest.raises(ValueError) as excinfo:
+        imputer.transform(numpy.ones((2, 3)))
+    assert "fitted with 2 features" in str(excinfo.value)
+
+
+def test_numpy_object_input():
+    """Test that the dtypes of a mixed-type array are inferred by column."""
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array([["A", 1.0], ["B", numpy.nan], [None, 3.0]], dtype=object)
+    result = Imputer(strategy="mean").fit_transform(array)
+
+    assert result.dtypes == [polars.Utf8, polars.Float64]
+    assert result["column_0"].null_count() == 1
+    assert result["column_1"].to_list() == [1.0, 2.0, 3.0]
+
+
+def test_sklearn_pipeline(with_numerical_nulls_polars_dataframe):
+    """Test the transformers inside a scikit-learn pipeline."""
+    pytest.importorskip("sklearn")
+    from sklearn.base import clone
+    from sklearn.pipeline import make_pipeline
+
+    x = with_numerical_nulls_polars_dataframe.select(["City", "Rain"])
+    y = with_numerical_nulls_polars_dataframe["Temperature"].to_numpy()
+    pipeline = make_pipeline(
+        Imputer(features_to_impute="Rain"),
+        TargetEncoder(smoothing=1, features_to_encode="City"),
+    ).set_output(transform="polars")
+
+    result = clone(pipeline).fit_transform(x.to_arrow(), y)
+
+    assert isinstance(result, polars.DataFrame)
+    assert result.null_count().sum_horizontal().item() == 0
+    assert list(pipeline.fit(x, y).get_feature_names_out()) == ["City", "Rain"]
+
+
+def test_lazy_transform(with_categorical_nulls_polars_dataframe):
+    """Test that a LazyFrame is transformed lazily, as a DataFrame would be."""
+    x = with_categorical_nulls_polars_dataframe.select(["City", "Rain"])
+    y = with_categorical_nulls_polars_dataframe["Temperature"].fill_null(0)
+    pipeline = Pipeline(
+        steps=[
+            Imputer(features_to_impute="Rain"),
+            TargetEncoder(smoothing=1, features_to_encode="City"),
+        ]
+    ).fit(x, y)
+
+    result = pipeline.transform(x.lazy())
+
+    assert isinstance(result, polars.LazyFrame)
+    assert result.collect().equals(pipeline.transform(x))
+
+
+def test_transform_file(tmp_path, with_numerical_nulls_polars_dataframe):
+    """Test streaming a parquet file into parquet and ipc files."""
+    src = tmp_path / "input.parquet"
+    with_numerical_nulls_polars_dataframe.write_parquet(src)
+    imputer = Imputer(features_to_impute="Rain").fit(
+        with_numerical_nulls_polars_dataframe
+    )
+
+    stats = imputer.transform_file(src, tmp_path / "output.parquet", chunk_size=2)
+    imputer.transform_file(src, tmp_path / "output.ipc")
+
+    assert stats["rows"] == 8
+    assert stats["rows_per_second"] > 0
+    for result in [
+        polars.read_parquet(tmp_path / "output.parquet"),
+        polars.read_ipc(tmp_path / "output.ipc"),
+    ]:
+        assert result.equals(imputer.transform(with_numerical_nulls_polars_dataframe))
+
+
+def test_transform_file_bad_extension(tmp_path):
+    """Test if an unknown file extension is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        Imputer().transform_file(tmp_path / "input.txt", tmp_path / "output.csv")
+    assert "file extension must be one of" in str(excinfo.value)
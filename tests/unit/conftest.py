@@ -61,3 +61,19 @@ def standard_polars_series():
     return polars.Series(
         "Rain", [103, 125, 90, 75, 130, 200, 155, 127], dtype=polars.Float32
     )
+
+
+@pytest.fixture
+def with_time_series_nulls_polars_dataframe():
+    """Fixture for a time series polars dataframe, unordered.
+
+    Returns:
+        polars.DataFrame: polars dataframe
+    """
+    return polars.DataFrame(
+        {
+            "Device": [1, 2, 1, 2, 1, 1, 2, 2],
+            "Time": [3, 1, 1, 2, 2, 4, 3, 0],
+            "Rain": [None, 1.0, 10.0, None, None, 40.0, 5.0, None],
+        }
+    )
@@ -0,0 +1,108 @@
+"""Test Binning.
+
+For the column `Rain` of the standard dataframe (75 to 200):
+-> The uniform edges with 5 bins should be: 75, 100, 125, 150, 175, 200
+-> The quartiles should be: 75, 99.75, 126, 136.25, 200
+"""
+import polars
+import pytest
+
+from fe_polars.discretizing.binning import Binner
+from fe_polars.encoding import OneHotEncoder, TargetEncoder
+
+
+def test_uniform_binning(standard_polars_dataframe):
+    """Test uniform binning.
+
+    - Assert that the edges are correct
+    - Assert that the bins are UInt8 indexes
+    """
+    binner = Binner(features_to_bin="Rain", n_bins=5, strategy="uniform")
+    result = binner.fit_transform(standard_polars_dataframe)
+
+    assert binner.mapping["Rain"] == [75, 100, 125, 150, 175, 200]
+    assert result["Rain"].dtype == polars.UInt8
+    assert result["Rain"].to_list() == [1, 2, 0, 0, 2, 4, 3, 2]
+
+
+def test_quantile_binning(with_numerical_nulls_polars_dataframe):
+    """Test quantile binning.
+
+    - Assert that each bin holds the same number of records
+    - Assert that null values stay null
+    """
+    binner = Binner(features_to_bin="Rain", n_bins=3)
+    result = binner.fit_transform(with_numerical_nulls_polars_dataframe)
+
+    assert result["Rain"].value_counts().sort("Rain")["count"].to_list() == [
+        2,
+        2,
+        2,
+        2,
+    ]
+    assert result["Rain"].null_count() == 2
+
+
+def test_approximate_quantile_binning(standard_polars_dataframe):
+    """Test quantiles approximated on a sample of the rows."""
+    binner = Binner(features_to_bin="Rain", n_bins=4, sample_fraction=0.5, seed=0)
+    result = binner.fit_transform(standard_polars_dataframe.lazy()).collect()
+
+    assert result["Rain"].max() <= 3
+    assert result["Rain"].null_count() == 0
+
+
+def test_approximate_quantile_edges_sorted():
+    """Test that the edges approximated on a sample are increasing."""
+    x = polars.DataFrame({"Rain": range(10_000)})
+    for _ in range(20):
+        binner = Binner(features_to_bin="Rain", n_bins=10, sample_fraction=0.001)
+        edges = binner.fit(x).mapping["Rain"]
+        assert edges == sorted(edges)
+
+
+def test_out_of_range(standard_polars_dataframe):
+    """Test that values out of the fitted range fall in the outer bins."""
+    binner = Binner(features_to_bin="Rain", n_bins=5, strategy="uniform")
+    binner.fit(standard_polars_dataframe)
+    result = binner.transform(polars.DataFrame({"Rain": [0, 1000]}))
+
+    assert result["Rain"].to_list() == [0, 4]
+
+
+def test_binning_then_encoding(standard_polars_dataframe):
+    """Test that the bins can be encoded directly."""
+    binned = Binner(features_to_bin="Rain", n_bins=2).fit_transform(
+        standard_polars_dataframe
+    )
+    target_encoded = TargetEncoder(
+        smoothing=1, features_to_encode="Rain"
+    ).fit_transform(binned.select("Rain"), binned["Temperature"])
+    one_hot_encoded = OneHotEncoder(features_to_encode="Rain").fit_transform(binned)
+
+    assert target_encoded["Rain"].n_unique() == 2
+    assert one_hot_encoded.columns == ["City", "Temperature", "Rain_0", "Rain_1"]
+
+
+def test_bad_strategy():
+    """Test if a wrong strategy is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = Binner(features_to_bin="Rain", strategy="bad-strategy")
+    assert str(excinfo.value) == "strategy must be one of ['uniform', 'quantile']"
+
+
+def test_transform_file(tmp_path, with_numerical_nulls_polars_dataframe):
+    """Test streaming a file through the binner."""
+    src = tmp_path / "input.parquet"
+    with_numerical_nulls_polars_dataframe.write_parquet(src)
+    binner = Binner(features_to_bin=["Temperature", "Rain"], n_bins=3)
+    binner.fit(with_numerical_nulls_polars_dataframe)
+
+    binner.transform_file(src, tmp_path / "output.parquet")
+    binner.transform_file(src, tmp_path / "output.csv")
+
+    expected = binner.transform(with_numerical_nulls_polars_dataframe)
+    assert polars.read_parquet(tmp_path / "output.parquet").equals(expected)
+    assert polars.read_csv(tmp_path / "output.csv", schema=expected.schema).equals(
+        expected
+    )
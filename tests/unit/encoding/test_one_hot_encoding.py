@@ -1,4 +1,5 @@
 """Test One Hot Encoding."""
+import polars
 import pytest
 
 from fe_polars.encoding.one_hot_encoding import OneHotEncoder
@@ -40,3 +41,23 @@ def test_bad_strategy():
     with pytest.raises(ValueError) as excinfo:
         _ = OneHotEncoder(features_to_encode=["City"], strategy="bad-strategy")
     assert str(excinfo.value) == "strategy must be one of ['keep', 'drop']"
+
+
+def test_one_hot_encoder_unseen(standard_polars_dataframe):
+    """Test that the dummy columns are the ones learned at fit.
+
+    - Assert that an unseen category does not create a new column
+    - Assert that a category missing from the data still has its column
+    """
+    encoder = OneHotEncoder(features_to_encode="City").fit(standard_polars_dataframe)
+    result = encoder.transform(polars.DataFrame({"City": ["A", "D"]}))
+
+    assert result.columns == ["City_A", "City_B", "City_C"]
+    assert result.row(1) == (0, 0, 0)
+
+
+def test_one_hot_encoder_not_fitted(standard_polars_dataframe):
+    """Test that transform raises before fit."""
+    with pytest.raises(ValueError) as excinfo:
+        OneHotEncoder(features_to_encode="City").transform(standard_polars_dataframe)
+    assert "not fitted" in str(excinfo.value)
@@ -0,0 +1,123 @@
+"""Test Online Target Encoding."""
+import math
+from datetime import datetime, timedelta
+
+import polars
+import pytest
+
+from fe_polars.encoding.online_target_encoding import OnlineTargetEncoder
+from fe_polars.encoding.target_encoding import TargetEncoder
+
+
+def test_online_target_encoding_without_decay(standard_polars_dataframe):
+    """Test that micro-batches at the same time give the batch encoding.
+
+    Records of the same event time have the same weight, so the encoding
+    must equal the one of `TargetEncoder` fitted on all the records.
+    """
+    x = standard_polars_dataframe.select("City").with_columns(time=polars.lit(0))
+    y = standard_polars_dataframe["Rain"]
+    encoder = OnlineTargetEncoder(
+        smoothing=1, features_to_encode="City", time_column="time", half_life=1
+    )
+    encoder.fit(x[:3], y[:3]).partial_fit(x[3:], y[3:])
+    expected = TargetEncoder(smoothing=1, features_to_encode="City").fit_transform(
+        x.select("City"), y
+    )
+
+    assert math.isclose(encoder.global_mean, 125.625)
+    assert encoder.transform(x.select("City")).equals(expected)
+
+
+def test_online_target_encoding_decay():
+    """Test the decay of the counts and sums.
+
+    A record one half-life older than the latest one weighs one half:
+    A: count = 0.5 + 1 = 1.5, sum = 0.5 * 0 + 1 * 1 = 1
+    After one more day, A is decayed by one half and B is added:
+    A: count = 0.75, sum = 0.5 and B: count = 1, sum = 1
+    """
+    encoder = OnlineTargetEncoder(
+        smoothing=0,
+        features_to_encode="City",
+        time_column="time",
+        half_life=timedelta(days=1),
+    )
+    encoder.fit(
+        x=polars.DataFrame(
+            {"City": ["A", "A"], "time": [datetime(2024, 1, 1), datetime(2024, 1, 2)]}
+        ),
+        y=polars.Series("Rain", [0.0, 1.0]),
+    )
+    assert encoder.decayed_counts("City").row(0) == ("A", 1.5, 1.0)
+
+    encoder.partial_fit(
+        x=polars.DataFrame({"City": ["B"], "time": [datetime(2024, 1, 3)]}),
+        y=polars.Series("Rain", [1.0]),
+    )
+    state = encoder.decayed_counts("City").sort("City")
+
+    assert state.rows() == [("A", 0.75, 0.5), ("B", 1.0, 1.0)]
+    assert math.isclose(encoder.global_mean, 1.5 / 1.75)
+    assert math.isclose(
+        encoder.transform(polars.DataFrame({"City": ["A"]})).item(), 2 / 3
+    )
+
+
+def test_online_target_encoding_rescale():
+    """Test that the state is rescaled and pruned after many half-lives.
+
+    A is last seen 100 half-lives before B, its weight falls below the
+    minimum weight and it is dropped, then encoded as unseen.
+    """
+    encoder = OnlineTargetEncoder(
+        smoothing=1, features_to_encode="City", time_column="time", half_life=1
+    )
+    encoder.fit(polars.DataFrame({"City": ["A"], "time": [0]}), polars.Series([0.0]))
+    for time in range(10, 101, 10):
+        encoder.partial_fit(
+            polars.DataFrame({"City": ["B"], "time": [time]}), polars.Series([1.0])
+        )
+
+    assert encoder.decayed_counts("City")["City"].to_list() == ["B"]
+    assert math.isclose(encoder.global_mean, 1.0)
+    assert math.isclose(
+        encoder.transform(polars.DataFrame({"City": ["A"]})).item(), 1.0
+    )
+
+
+@pytest.mark.parametrize(
+    "batches",
+    [
+        [(["A"], [100]), (["B"], [-2000])],
+        [(["B", "A"], [0, 1100])],
+    ],
+)
+def test_online_target_encoding_underflow(batches):
+    """Test that records whose weight underflows are encoded as unseen.
+
+    Category B is more than 1074 half-lives older than the latest record,
+    its weight is 0.0 and it must not be encoded as NaN.
+    """
+    encoder = OnlineTargetEncoder(
+        smoothing=1, features_to_encode="City", time_column="time", half_life=1
+    )
+    for i, (cities, times) in enumerate(batches):
+        x = polars.DataFrame({"City": cities, "time": times})
+        y = polars.Series([1.0] * len(cities))
+        if i == 0:
+            encoder.fit(x, y)
+        else:
+            encoder.partial_fit(x, y)
+
+    assert encoder.decayed_counts("City")["City"].to_list() == ["A"]
+    assert encoder.transform(polars.DataFrame({"City": ["B"]})).item() == 1.0
+
+
+def test_bad_half_life():
+    """Test if a wrong half-life is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = OnlineTargetEncoder(
+            smoothing=1, features_to_encode="City", time_column="time", half_life=0
+        )
+    assert str(excinfo.value) == "half_life must be positive"
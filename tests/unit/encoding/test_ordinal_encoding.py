@@ -0,0 +1,65 @@
+"""Test Ordinal Encoding.
+
+The `City` column of the standard dataframe holds A twice, B and C three
+times. By frequency (ties in lexical order) the codes are B: 3, C: 4, A: 5.
+"""
+import polars
+import pytest
+
+from fe_polars.encoding.ordinal_encoding import (
+    NULL_CODE,
+    OTHER_CODE,
+    UNKNOWN_CODE,
+    OrdinalEncoder,
+)
+
+
+def test_ordinal_encoding(standard_polars_dataframe):
+    """Test ordinal encoding by frequency.
+
+    - Assert that the codes follow the frequencies
+    - Assert that the codes are stored as UInt8
+    """
+    encoder = OrdinalEncoder(features_to_encode="City")
+    result = encoder.fit_transform(standard_polars_dataframe)
+
+    assert encoder.mapping["City"]["categories"] == ["B", "C", "A"]
+    assert result["City"].dtype == polars.UInt8
+    assert result["City"].to_list() == [5, 5, 3, 3, 3, 4, 4, 4]
+
+
+def test_lexical_ordering(standard_polars_dataframe):
+    """Test ordinal encoding in lexical order, on a numerical feature too."""
+    encoder = OrdinalEncoder(features_to_encode=["City", "Rain"], ordering="lexical")
+    result = encoder.fit_transform(standard_polars_dataframe.lazy()).collect()
+
+    assert result["City"].to_list() == [3, 3, 4, 4, 4, 5, 5, 5]
+    assert result["Rain"].to_list() == [5, 6, 4, 3, 8, 10, 9, 7]
+
+
+@pytest.mark.parametrize("dtype", [polars.Utf8, polars.Categorical])
+def test_reserved_codes(standard_polars_dataframe, dtype):
+    """Test the codes of null, unknown and rare values."""
+    encoder = OrdinalEncoder(features_to_encode="City", max_categories=2)
+    encoder.fit(standard_polars_dataframe.with_columns(polars.col("City").cast(dtype)))
+    result = encoder.transform(
+        polars.DataFrame({"City": ["B", "C", "A", "D", None]}, schema={"City": dtype})
+    )
+
+    assert result["City"].to_list() == [3, 4, OTHER_CODE, UNKNOWN_CODE, NULL_CODE]
+
+
+def test_code_dtype():
+    """Test that the codes use the smallest sufficient dtype."""
+    x = polars.DataFrame({"Id": [str(i) for i in range(300)]})
+    result = OrdinalEncoder(features_to_encode="Id").fit_transform(x)
+
+    assert result["Id"].dtype == polars.UInt16
+    assert result["Id"].max() == 302
+
+
+def test_bad_ordering():
+    """Test if a wrong ordering is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = OrdinalEncoder(features_to_encode="City", ordering="bad-ordering")
+    assert str(excinfo.value) == "ordering must be one of ['frequency', 'lexical']"
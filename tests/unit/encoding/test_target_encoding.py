@@ -61,22 +61,31 @@ def test_target_encoding(standard_polars_dataframe):
 
 
 def test_target_encoding_nulls(
-    caplog, standard_polars_dataframe, with_categorical_nulls_polars_dataframe
+    standard_polars_dataframe, with_categorical_nulls_polars_dataframe
 ):
-    """Test target encoding with dataframe with null values.
+    """Test target encoding with dataframe with null and unseen values.
 
-    - Assert that the logger.warning is triggered correctly.
+    - Assert that null and unseen values are counted by batch and in total
+    - Assert that they are replaced by the global mean
     """
     encoder = TargetEncoder(smoothing=1, features_to_encode=["City"])
     encoder.fit(
         x=standard_polars_dataframe.select(polars.col("City")),
         y=standard_polars_dataframe.select(polars.col("Rain")),
     )
-    encoder.transform(
+    result = encoder.transform(
         x=with_categorical_nulls_polars_dataframe.select(polars.col("City"))
     )
-
-    assert "['City'] have unseen values, defaults to global mean" in caplog.text
+    encoder.transform(x=polars.DataFrame({"City": ["A", "D"]}))
+    metrics = encoder.metrics.to_dict()
+
+    assert math.isclose(result["City"][4], 125.625)
+    assert metrics["n_batches"] == 2
+    assert metrics["counts"] == {"City": {"null": 2, "unseen": 1}}
+    assert metrics["last_batch"]["counts"] == {"City": {"null": 0, "unseen": 1}}
+    assert metrics["last_batch"]["rates"] == {
+        "City": {"null_rate": 0.0, "unseen_rate": 0.5}
+    }
 
 
 def test_target_encoding_with_series(standard_polars_dataframe, standard_polars_series):
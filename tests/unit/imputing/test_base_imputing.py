@@ -23,6 +23,7 @@ then values).
 """
 import math
 
+import polars
 import pytest
 
 from fe_polars.imputing.base_imputing import Imputer
@@ -166,3 +167,101 @@ def test_fixed_value_and_strategy(with_numerical_nulls_polars_dataframe):
     result = imputer.fit_transform(with_numerical_nulls_polars_dataframe)
     result = result.select("Rain")[1, :].item()
     assert math.isclose(result, 1.0)
+
+
+def test_imputed_metrics(with_numerical_nulls_polars_dataframe):
+    """Test that the imputed nulls are counted."""
+    imputer = Imputer(features_to_impute="Rain")
+    imputer.fit_transform(with_numerical_nulls_polars_dataframe)
+    assert imputer.metrics.n_batches == 0
+
+    imputer.transform(with_numerical_nulls_polars_dataframe)
+    assert imputer.metrics.counts == {"Rain": {"imputed": 2}}
+    assert imputer.metrics.to_dict()["rates"] == {"Rain": {"imputed_rate": 0.25}}
+
+
+@pytest.mark.parametrize(
+    "strategy, expected",
+    [
+        ("forward_fill", [10.0, 10.0, 10.0, 40.0, 14.0, 1.0, 1.0, 5.0]),
+        ("backward_fill", [10.0, 40.0, 40.0, 40.0, 1.0, 1.0, 5.0, 5.0]),
+        ("interpolate", [10.0, 20.0, 30.0, 40.0, 14.0, 1.0, 3.0, 5.0]),
+        ("rolling_mean", [10.0, 10.0, 14.0, 40.0, 14.0, 1.0, 1.0, 5.0]),
+    ],
+)
+def test_ordered_imputing(with_time_series_nulls_polars_dataframe, strategy, expected):
+    """Test ordered strategies by device, ordered by time.
+
+    The records are sorted by device and time to compare them. The nulls
+    that cannot be filled (leading nulls of device 2, or a rolling window
+    of 2 records without values) get the global mean: 14.
+    """
+    imputer = Imputer(
+        features_to_impute="Rain",
+        strategy=strategy,
+        order_by="Time",
+        partition_by="Device",
+        window_size=2,
+    )
+    result = imputer.fit_transform(with_time_series_nulls_polars_dataframe)
+
+    assert imputer.mapping == {"Rain": 14.0}
+    assert result.sort(["Device", "Time"])["Rain"].to_list() == expected
+    assert result["Time"].equals(with_time_series_nulls_polars_dataframe["Time"])
+
+
+def test_ordered_imputing_lazy(with_time_series_nulls_polars_dataframe):
+    """Test fitting and transforming a LazyFrame with an ordered strategy."""
+    imputer = Imputer(
+        strategy_dict={"forward_fill": ["Rain"]},
+        order_by="Time",
+        partition_by="Device",
+        fallback="max",
+    )
+    lazy = with_time_series_nulls_polars_dataframe.lazy()
+    result = imputer.fit(lazy).transform(lazy)
+
+    assert isinstance(result, polars.LazyFrame)
+    assert result.collect().equals(
+        imputer.transform(with_time_series_nulls_polars_dataframe)
+    )
+    assert imputer.mapping == {"Rain": 40.0}
+
+
+def test_bad_fallback():
+    """Test if a wrong fallback is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = Imputer(strategy="forward_fill", fallback="fixed_value")
+    assert "fallback must be one of" in str(excinfo.value)
+
+
+def test_rolling_mean_imputing_nan():
+    """Test that a NaN only affects its own rolling windows.
+
+    The rolling mean of the last record is computed from 2 and 3 only,
+    without cancellation from the large first value.
+    """
+    x = polars.DataFrame(
+        {
+            "Time": [0, 1, 2, 3, 4],
+            "Nan": [1.0, float("nan"), 2.0, 3.0, None],
+            "Large": [1e17, 1.0, 2.0, 3.0, None],
+        }
+    )
+    imputer = Imputer(
+        features_to_impute=["Nan", "Large"],
+        strategy="rolling_mean",
+        order_by="Time",
+        window_size=3,
+    )
+    result = imputer.fit_transform(x)
+
+    assert result["Nan"][-1] == 2.5
+    assert result["Large"][-1] == 2.5
+
+
+def test_interpolate_several_order_by():
+    """Test that interpolating by several features is refused."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = Imputer(strategy="interpolate", order_by=["Device", "Time"])
+    assert "only be ordered by one feature" in str(excinfo.value)
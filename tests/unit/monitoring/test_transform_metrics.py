@@ -0,0 +1,33 @@
+"""Test Transform Metrics."""
+from fe_polars.monitoring.transform_metrics import TransformMetrics
+
+
+def test_transform_metrics():
+    """Test transform metrics.
+
+    - Assert that the counts are accumulated over the batches
+    - Assert that the last batch is kept apart
+    """
+    metrics = TransformMetrics()
+    metrics.update(rows=10, counts={"City": {"unseen": 1}})
+    metrics.update(rows=30, counts={"City": {"unseen": 3}, "Rain": {"imputed": 6}})
+    result = metrics.to_dict()
+
+    assert result["n_batches"] == 2
+    assert result["rows"] == 40
+    assert result["counts"] == {"City": {"unseen": 4}, "Rain": {"imputed": 6}}
+    assert result["rates"] == {
+        "City": {"unseen_rate": 0.1},
+        "Rain": {"imputed_rate": 0.15},
+    }
+    assert result["last_batch"]["rates"]["Rain"] == {"imputed_rate": 0.2}
+
+
+def test_reset():
+    """Test resetting the counters."""
+    metrics = TransformMetrics()
+    metrics.update(rows=10, counts={"City": {"unseen": 1}})
+    metrics.reset()
+
+    assert metrics.to_dict()["counts"] == {}
+    assert metrics.rows == 0
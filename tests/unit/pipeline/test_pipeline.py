@@ -0,0 +1,93 @@
+"""Test Pipeline."""
+import math
+
+import polars
+
+from fe_polars.encoding import OneHotEncoder, TargetEncoder
+from fe_polars.imputing import Imputer
+from fe_polars.pipeline.pipeline import Pipeline
+
+
+def test_pipeline(with_numerical_nulls_polars_dataframe):
+    """Test pipeline.
+
+    - Assert that the steps are applied one after the other
+    - Assert that the result equals applying the steps by hand
+    """
+    x = with_numerical_nulls_polars_dataframe.select(["City", "Rain"])
+    y = with_numerical_nulls_polars_dataframe["Temperature"]
+
+    pipeline = Pipeline(
+        steps=[
+            Imputer(features_to_impute=["Rain"], strategy="mean"),
+            TargetEncoder(smoothing=1, features_to_encode=["City"]),
+        ]
+    )
+    result = pipeline.fit_transform(x, y)
+
+    imputed = Imputer(features_to_impute=["Rain"], strategy="mean").fit_transform(x)
+    expected = TargetEncoder(smoothing=1, features_to_encode=["City"]).fit_transform(
+        imputed, y
+    )
+
+    assert result.equals(expected)
+    assert result["Rain"].null_count() == 0
+    assert math.isclose(result["Rain"][1], 125, abs_tol=0.001)
+    assert pipeline.profile.null_count["Rain"] == 2
+
+
+def test_pipeline_stale_profile(with_numerical_nulls_polars_dataframe):
+    """Test that a step does not use the profile of a column changed before it.
+
+    The second imputer would find no nulls to impute in `Rain` if it read
+    the null counts of the raw data.
+    """
+    pipeline = Pipeline(
+        steps=[
+            OneHotEncoder(features_to_encode="City", strategy="drop"),
+            Imputer(features_to_impute=["Rain"], strategy="min"),
+            Imputer(strategy="max"),
+        ]
+    )
+    result = pipeline.fit_transform(with_numerical_nulls_polars_dataframe)
+
+    assert pipeline.steps[2].features_to_impute == []
+    assert "City_A" in result.columns
+    assert math.isclose(result["Rain"][1], 75, abs_tol=0.001)
+
+
+def test_pipeline_sampled_profile():
+    """Test that a null missed by a sampled profile is still imputed."""
+    x = polars.DataFrame({"Rain": [None] + [float(i) for i in range(99)]})
+    pipeline = Pipeline(steps=[Imputer(strategy="mean")], sample_fraction=0.1, seed=1)
+    result = pipeline.fit_transform(x)
+
+    assert pipeline.profile.null_count["Rain"] == 0
+    assert pipeline.steps[0].features_to_impute == ["Rain"]
+    assert result["Rain"].null_count() == 0
+
+
+def test_pipeline_metrics(with_numerical_nulls_polars_dataframe):
+    """Test that the training data is not counted in the metrics."""
+    imputer = Imputer(features_to_impute=["Rain"])
+    pipeline = Pipeline(steps=[imputer, OneHotEncoder(features_to_encode="City")])
+    pipeline.fit_transform(with_numerical_nulls_polars_dataframe)
+    assert imputer.metrics.n_batches == 0
+
+    pipeline.transform(with_numerical_nulls_polars_dataframe)
+    assert imputer.metrics.n_batches == 1
+    assert imputer.metrics.counts == {"Rain": {"imputed": 2}}
+
+
+def test_pipeline_lazy_fit(with_numerical_nulls_polars_dataframe):
+    """Test fitting the encoders of a pipeline on a LazyFrame."""
+    x = with_numerical_nulls_polars_dataframe.select(["City", "Rain"])
+    y = with_numerical_nulls_polars_dataframe["Temperature"]
+    steps = [
+        Imputer(features_to_impute=["Rain"]),
+        OneHotEncoder(features_to_encode="City", strategy="keep"),
+        TargetEncoder(smoothing=1, features_to_encode=["City"]),
+    ]
+    lazy = Pipeline(steps=steps).fit(x.lazy(), y)
+
+    assert lazy.transform(x).equals(Pipeline(steps=steps).fit_transform(x, y))
@@ -0,0 +1,73 @@
+"""Test Data Profile."""
+import polars
+import pytest
+
+from fe_polars.imputing import Imputer
+from fe_polars.profile.data_profile import DataProfile
+
+
+def test_data_profile(with_categorical_nulls_polars_dataframe):
+    """Test data profile.
+
+    - Assert that null counts, distinct counts and min/max are correct
+    - Assert that min/max are only computed for numerical features
+    """
+    profile = DataProfile().fit(with_categorical_nulls_polars_dataframe)
+
+    assert profile.height == 8
+    assert profile.columns == ["City", "Temperature", "Rain"]
+    assert profile.null_count == {"City": 2, "Temperature": 1, "Rain": 1}
+    assert profile.n_unique["City"] == 4
+    assert profile.min == {"Temperature": 21.3, "Rain": 75}
+    assert profile.max == {"Temperature": 40, "Rain": 200}
+    assert profile.has_nulls("City")
+    assert not profile.sampled
+
+
+def test_data_profile_lazy(standard_polars_dataframe):
+    """Test if a LazyFrame gives the same profile as a DataFrame."""
+    eager = DataProfile().fit(standard_polars_dataframe)
+    lazy = DataProfile().fit(standard_polars_dataframe.lazy())
+
+    assert eager.schema == lazy.schema
+    assert eager.null_count == lazy.null_count
+    assert eager.min == lazy.min
+
+
+def test_data_profile_sample(standard_polars_dataframe):
+    """Test profiling on a sample of the rows."""
+    profile = DataProfile(sample_fraction=0.5, seed=0).fit(standard_polars_dataframe)
+    lazy_profile = DataProfile(sample_fraction=0.5).fit(
+        standard_polars_dataframe.lazy()
+    )
+
+    assert profile.sampled
+    assert profile.height == 4
+    assert lazy_profile.height == 4
+
+
+def test_data_profile_drop(standard_polars_dataframe):
+    """Test dropping columns from a profile."""
+    profile = DataProfile().fit(standard_polars_dataframe).drop(["Rain"])
+
+    assert profile.columns == ["City", "Temperature"]
+    assert "Rain" not in profile.min
+    assert profile.height == 8
+
+
+def test_bad_sample_fraction():
+    """Test if a wrong sample fraction is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = DataProfile(sample_fraction=0)
+    assert str(excinfo.value) == "sample_fraction must be in (0, 1]"
+
+
+def test_imputer_with_profile(with_numerical_nulls_polars_dataframe):
+    """Test if the profile null counts drive the imputer automatic mode."""
+    profile = DataProfile().fit(with_numerical_nulls_polars_dataframe)
+    imputer = Imputer(strategy="max").fit(
+        with_numerical_nulls_polars_dataframe, profile=profile
+    )
+
+    assert imputer.mapping == {"Rain": 200}
+    assert isinstance(profile.schema["Rain"], polars.Int64)
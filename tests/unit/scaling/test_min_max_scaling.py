@@ -0,0 +1,50 @@
+"""Test Min Max Scaling."""
+import math
+
+import pytest
+
+from fe_polars.profile import DataProfile
+from fe_polars.scaling.min_max_scaling import MinMaxScaler
+
+
+def test_min_max_scaling(standard_polars_dataframe):
+    """Test min max scaling.
+
+    - Assert that the scaled feature spans the feature range
+    """
+    scaler = MinMaxScaler(features_to_scale="Rain", feature_range=(-1, 1))
+    result = scaler.fit_transform(standard_polars_dataframe)
+
+    assert result["Rain"].min() == -1
+    assert result["Rain"].max() == 1
+    assert scaler.mapping["Rain"] == {"min": 75, "max": 200}
+
+
+def test_min_max_with_profile(standard_polars_dataframe):
+    """Test that min and max are read from the profile."""
+    profile = DataProfile().fit(standard_polars_dataframe)
+    profile.max["Rain"] = 275
+    scaler = MinMaxScaler(features_to_scale="Rain").fit(
+        standard_polars_dataframe, profile=profile
+    )
+
+    assert scaler.mapping["Rain"] == {"min": 75, "max": 275}
+
+
+def test_partial_fit(with_numerical_nulls_polars_dataframe):
+    """Test that fitting by batches gives the statistics of a single fit."""
+    scaler = MinMaxScaler(features_to_scale="Rain")
+    for batch in with_numerical_nulls_polars_dataframe.iter_slices(n_rows=2):
+        scaler.partial_fit(batch)
+
+    assert scaler.mapping["Rain"] == {"min": 75, "max": 200}
+    assert math.isclose(
+        scaler.transform(with_numerical_nulls_polars_dataframe)["Rain"][0], 0.224
+    )
+
+
+def test_bad_feature_range():
+    """Test if a wrong feature range is correctly handled."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = MinMaxScaler(features_to_scale="Rain", feature_range=(1, 0))
+    assert "feature_range" in str(excinfo.value)
@@ -0,0 +1,52 @@
+"""Test Robust Scaling.
+
+For the column `Rain` of the standard dataframe:
+-> The median should be: 126
+-> The 25th and 75th percentiles should be: 99.75 and 136.25
+"""
+import math
+
+import polars
+import pytest
+
+from fe_polars.scaling.robust_scaling import RobustScaler
+
+
+def test_robust_scaling(standard_polars_dataframe):
+    """Test robust scaling.
+
+    - Assert that the median and the quantiles are correct
+    - Assert that the median is mapped to 0
+    """
+    scaler = RobustScaler(features_to_scale="Rain")
+    result = scaler.fit_transform(standard_polars_dataframe)
+
+    assert scaler.mapping["Rain"] == {"median": 126, "low": 99.75, "high": 136.25}
+    assert math.isclose(result["Rain"].median(), 0)
+
+
+def test_approximate_quantiles(standard_polars_dataframe):
+    """Test quantiles approximated on a sample of the rows."""
+    scaler = RobustScaler(features_to_scale="Rain", sample_fraction=0.5, seed=0)
+    scaler.fit(standard_polars_dataframe)
+
+    assert 75 <= scaler.mapping["Rain"]["low"] <= scaler.mapping["Rain"]["high"]
+
+
+def test_approximate_quantiles_one_sample():
+    """Test that all the quantiles are computed on the same sample."""
+    x = polars.DataFrame({"Rain": range(10_000)})
+    for _ in range(20):
+        scaler = RobustScaler(
+            features_to_scale="Rain", quantile_range=(45, 55), sample_fraction=0.001
+        ).fit(x)
+        statistics = scaler.mapping["Rain"]
+        assert statistics["low"] <= statistics["median"] <= statistics["high"]
+
+
+def test_no_partial_fit(standard_polars_dataframe):
+    """Test that partial fit is refused, even before the first fit."""
+    scaler = RobustScaler(features_to_scale="Rain")
+    with pytest.raises(ValueError) as excinfo:
+        scaler.partial_fit(standard_polars_dataframe)
+    assert "does not support partial_fit" in str(excinfo.value)
@@ -0,0 +1,61 @@
+"""Test Standard Scaling.
+
+For the column `Rain` of the standard dataframe:
+-> The mean should be: 125.625
+-> The standard deviation should be: 37.443
+"""
+import math
+
+import polars
+import pytest
+
+from fe_polars.scaling.standard_scaling import StandardScaler
+
+
+def test_standard_scaling(standard_polars_dataframe):
+    """Test standard scaling.
+
+    - Assert that the scaled feature has a null mean and a unit deviation
+    - Assert that the other features are not modified
+    """
+    scaler = StandardScaler(features_to_scale=["Rain", "Temperature"])
+    result = scaler.fit_transform(standard_polars_dataframe)
+
+    assert math.isclose(scaler.mapping["Rain"]["mean"], 125.625)
+    assert math.isclose(result["Rain"].mean(), 0, abs_tol=1e-9)
+    assert math.isclose(result["Rain"].std(ddof=0), 1)
+    assert result["City"].equals(standard_polars_dataframe["City"])
+
+
+def test_partial_fit(with_numerical_nulls_polars_dataframe):
+    """Test that fitting by batches gives the statistics of a single fit."""
+    scaler = StandardScaler(features_to_scale="Rain")
+    for batch in with_numerical_nulls_polars_dataframe.iter_slices(n_rows=3):
+        scaler.partial_fit(batch)
+    expected = StandardScaler(features_to_scale="Rain").fit(
+        with_numerical_nulls_polars_dataframe
+    )
+
+    assert scaler.mapping["Rain"]["count"] == 6
+    for statistic in ["mean", "m2"]:
+        assert math.isclose(
+            scaler.mapping["Rain"][statistic], expected.mapping["Rain"][statistic]
+        )
+
+
+def test_lazy_standard_scaling(standard_polars_dataframe):
+    """Test fitting and transforming a LazyFrame."""
+    scaler = StandardScaler(features_to_scale="Rain")
+    result = scaler.fit(standard_polars_dataframe.lazy()).transform(
+        standard_polars_dataframe.lazy()
+    )
+
+    assert isinstance(result, polars.LazyFrame)
+    assert result.collect().equals(scaler.transform(standard_polars_dataframe))
+
+
+def test_categorical_value(standard_polars_dataframe):
+    """Test error message when providing a categorical value."""
+    with pytest.raises(ValueError) as excinfo:
+        StandardScaler(features_to_scale="City").fit(standard_polars_dataframe)
+    assert str(excinfo.value) == "City is not a numerical feature"